@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import bisect
+import contextlib
 import functools
-from typing import List
-
+import itertools
+import operator
+import os
+import struct
+import time
+from random import Random
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, TextIO, Tuple, Union
+)
+
+from collections import Counter
 from dataclasses import dataclass
 
 from Options import OptionSet
@@ -12,6 +25,13 @@ from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
 
+# The framework imports every game module at startup, so modules only needed by the analysis,
+# codec and snapshot tooling are imported where they are used
+if TYPE_CHECKING:
+    import mmap
+
+    from fractions import Fraction
+
 
 @dataclass
 class PopulousTheBeginningArchipelagoOptions:
@@ -19,6 +39,843 @@ class PopulousTheBeginningArchipelagoOptions:
     poptb_gimmicks: PopulousTBGimmickMissions
 
 
+class PlanetPoolCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class PopulousCatalogError(ValueError):
+    issues: List[str]
+
+    def __init__(self, issues: List[str]) -> None:
+        self.issues = issues
+        super().__init__("Invalid Populous mission catalog:\n" + "\n".join(f"- {issue}" for issue in issues))
+
+
+class FrozenGameObjectiveTemplate(GameObjectiveTemplate):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        object.__setattr__(self, "data", MappingProxyType(dict(self.data)))
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Shared objective template '{self.label}' cannot be modified")
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Shared objective template '{self.label}' cannot be modified")
+
+        super().__delattr__(name)
+
+
+class StringTable:
+    strings: List[str]
+    ids: Dict[str, int]
+
+    def __init__(self) -> None:
+        self.strings = list()
+        self.ids = dict()
+
+    def intern(self, text: str) -> int:
+        string_id: Optional[int] = self.ids.get(text)
+
+        if string_id is None:
+            string_id = len(self.strings)
+
+            self.strings.append(text)
+            self.ids[text] = string_id
+
+        return string_id
+
+    def intern_all(self, texts: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self.intern(text) for text in texts)
+
+    def text(self, string_id: int) -> str:
+        return self.strings[string_id]
+
+    def texts(self, string_ids: Iterable[int]) -> Tuple[str, ...]:
+        return tuple(map(self.strings.__getitem__, string_ids))
+
+    def sorted(self, string_ids: Iterable[int]) -> Tuple[int, ...]:
+        return tuple(sorted(string_ids, key=self.strings.__getitem__))
+
+
+# Mission, challenge and spell names are stored once here; pools hold their ids
+STRINGS: StringTable = StringTable()
+
+
+class PopulousMission(NamedTuple):
+    campaign: str
+    number: int
+    title: str
+    is_gimmick: bool = False
+
+    # None means not catalogued yet, in which case the mission is assumed to support every entry
+    enemy_tribes: Optional[FrozenSet[str]] = None
+    spells: Optional[FrozenSet[str]] = None
+    vehicles: Optional[FrozenSet[str]] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.campaign} - {self.number}: {self.title}"
+
+
+BASE_CAMPAIGN: str = "The Beginning"
+
+# Community campaign option keys mapped to the campaign names used in mission labels
+CAMPAIGNS_BY_OPTION: Dict[str, str] = {
+    "Undiscovered Worlds": "Undiscovered Worlds",
+    "Tikals Journey": "Tikal's Journey",
+    "Kataras Voyage": "Katara's Voyage",
+    "The Devil System Chapter 1": "The Devil System C1",
+    "Ascension Chapter 1": "Ascension",
+    "The Witching Hour": "The Witching Hour",
+    "Seasons: Spring": "Seasons: Spring",
+    "Seasons: Summer": "Seasons: Summer",
+    "Seasons: Fall": "Seasons: Autumn",
+    "Seasons: Winter": "Seasons: Winter",
+    "War of the Gods": "War of the Gods",
+    "Adaptive AI": "Adaptive AI",
+}
+
+class MissionEstimate(NamedTuple):
+    minutes: int
+    difficulty: int
+
+
+# Rough play time per campaign: minutes for its first mission and extra minutes for each mission after it.
+# Measured times belong in MISSION_ESTIMATE_OVERRIDES, which always wins over this model.
+CAMPAIGN_DURATIONS: Dict[str, Tuple[int, int]] = {
+    "The Beginning": (10, 2),
+    "Undiscovered Worlds": (25, 2),
+    "Tikal's Journey": (20, 2),
+    "Katara's Voyage": (25, 2),
+    "Ascension": (25, 2),
+    "The Witching Hour": (30, 2),
+    "The Devil System C1": (20, 1),
+    "Seasons: Spring": (25, 2),
+    "Seasons: Summer": (25, 2),
+    "Seasons: Autumn": (25, 2),
+    "Seasons: Winter": (25, 2),
+    "War of the Gods": (40, 2),
+    "Adaptive AI": (45, 0),
+}
+
+# No mission has been timed yet, so every estimate currently comes from the linear model above
+MISSION_ESTIMATE_OVERRIDES: Dict[Tuple[str, int], MissionEstimate] = dict()
+
+
+def estimate_mission(mission: PopulousMission, campaign_size: int) -> MissionEstimate:
+    override: Optional[MissionEstimate] = MISSION_ESTIMATE_OVERRIDES.get((mission.campaign, mission.number))
+
+    if override is not None:
+        return override
+
+    first, step = CAMPAIGN_DURATIONS.get(mission.campaign, (30, 2))
+
+    # Difficulty runs from 1 to 5 over the course of a campaign
+    difficulty: int = 1 + round(4 * (mission.number - 1) / max(campaign_size - 1, 1))
+
+    return MissionEstimate(minutes=first + step * (mission.number - 1), difficulty=difficulty)
+
+
+# Static pools that depend on a mission feature, mapped to the PopulousMission field describing it
+MISSION_REQUIREMENTS: Dict[str, str] = {
+    "tribe": "enemy_tribes",
+    "spells": "spells",
+    "buildables": "vehicles",
+}
+
+# Template placeholder keys filled from supported_pool(), mapped to the pool name it is called with
+SUPPORTED_POOL_KEYS: Dict[str, str] = {
+    "TRIBE": "tribe",
+    "SPELLS": "spells",
+    "BUILDABLES": "buildables",
+}
+
+
+class MissionCatalog(NamedTuple):
+    missions: Tuple[PopulousMission, ...]
+    by_campaign: Dict[str, Tuple[PopulousMission, ...]]
+    by_gimmick: Dict[bool, Tuple[PopulousMission, ...]]
+    label_ids: Dict[Tuple[str, bool], Tuple[int, ...]]
+    supporting: Dict[str, Dict[str, FrozenSet[int]]]
+    estimates: Dict[int, MissionEstimate]
+
+
+# Kept inside a function so importing the module does not build the catalog
+def load_missions() -> Tuple[PopulousMission, ...]:
+    return (
+        PopulousMission("The Beginning", 1, "The Journey Begins"),
+        PopulousMission("The Beginning", 2, "Night Falls"),
+        PopulousMission("The Beginning", 3, "Crisis of Faith"),
+        PopulousMission("The Beginning", 4, "Combined Forces"),
+        PopulousMission("The Beginning", 5, "Death from Above", is_gimmick=True),
+        PopulousMission("The Beginning", 6, "Building Bridges"),
+        PopulousMission("The Beginning", 7, "Unseen Enemy"),
+        PopulousMission("The Beginning", 8, "Continental Divide"),
+        PopulousMission("The Beginning", 9, "Fire in the Mist"),
+        PopulousMission("The Beginning", 10, "From the Depths", is_gimmick=True),
+        PopulousMission("The Beginning", 11, "Treacherous Souls"),
+        PopulousMission("The Beginning", 12, "An Easy Target"),
+        PopulousMission("The Beginning", 13, "Aerial Bombardment"),
+        PopulousMission("The Beginning", 14, "Attacked From All Sides"),
+        PopulousMission("The Beginning", 15, "Incarcerated", is_gimmick=True),
+        PopulousMission("The Beginning", 16, "Bloodlust"),
+        PopulousMission("The Beginning", 17, "Middle Ground"),
+        PopulousMission("The Beginning", 18, "Head Hunter"),
+        PopulousMission("The Beginning", 19, "Unlikely Allies"),
+        PopulousMission("The Beginning", 20, "Archipelago"),
+        PopulousMission("The Beginning", 21, "Fractured Earth"),
+        PopulousMission("The Beginning", 22, "Solo", is_gimmick=True),
+        PopulousMission("The Beginning", 23, "Inferno"),
+        PopulousMission("The Beginning", 24, "Journey's End"),
+        PopulousMission("The Beginning", 25, "The Beginning", is_gimmick=True),
+
+        PopulousMission("Undiscovered Worlds", 1, "Aftermath"),
+        PopulousMission("Undiscovered Worlds", 2, "Lava Flow"),
+        PopulousMission("Undiscovered Worlds", 3, "Soul Survivor"),
+        PopulousMission("Undiscovered Worlds", 4, "World Wide Web"),
+        PopulousMission("Undiscovered Worlds", 5, "Human Shield"),
+        PopulousMission("Undiscovered Worlds", 6, "No Man's Land", is_gimmick=True),
+        PopulousMission("Undiscovered Worlds", 7, "Protection Racket"),
+        PopulousMission("Undiscovered Worlds", 8, "Prisons", is_gimmick=True),
+        PopulousMission("Undiscovered Worlds", 9, "Overshadowed"),
+        PopulousMission("Undiscovered Worlds", 10, "Fortress"),
+        PopulousMission("Undiscovered Worlds", 11, "L'Assassine", is_gimmick=True),
+        PopulousMission("Undiscovered Worlds", 12, "Natural Disaster", is_gimmick=True),
+
+        PopulousMission("Tikal's Journey", 1, "No Turning Back"),
+        PopulousMission("Tikal's Journey", 2, "Outnumbered?"),
+        PopulousMission("Tikal's Journey", 3, "Painful Magic"),
+        PopulousMission("Tikal's Journey", 4, "Daki-Tak Island"),
+        PopulousMission("Tikal's Journey", 5, "Hidden In Darkness"),
+        PopulousMission("Tikal's Journey", 6, "Two For One Deal"),
+        PopulousMission("Tikal's Journey", 7, "Cyclone Fury"),
+        PopulousMission("Tikal's Journey", 8, "Helping Hands"),
+        PopulousMission("Tikal's Journey", 9, "Island Hopping"),
+        PopulousMission("Tikal's Journey", 10, "Desert Mirage"),
+        PopulousMission("Tikal's Journey", 11, "War on the Isle"),
+        PopulousMission("Tikal's Journey", 12, "Tensions Arise"),
+        PopulousMission("Tikal's Journey", 13, "Fire in the Hole"),
+        PopulousMission("Tikal's Journey", 14, "Bog Killer"),
+        PopulousMission("Tikal's Journey", 15, "Undercover From Death"),
+        PopulousMission("Tikal's Journey", 16, "Boat Skirmish"),
+        PopulousMission("Tikal's Journey", 17, "Quake Wars"),
+        PopulousMission("Tikal's Journey", 18, "Matak Alcatraz", is_gimmick=True),
+        PopulousMission("Tikal's Journey", 19, "Eye of the Unbelieving"),
+        PopulousMission("Tikal's Journey", 20, "Size Matters"),
+        PopulousMission("Tikal's Journey", 21, "Tribal Struggle", is_gimmick=True),
+        PopulousMission("Tikal's Journey", 22, "Volcanic Angels"),
+        PopulousMission("Tikal's Journey", 23, "Twilight Ascends"),
+        PopulousMission("Tikal's Journey", 24, "Against All Odds"),
+        PopulousMission("Tikal's Journey", 25, "Raising Hell"),
+
+        PopulousMission("Katara's Voyage", 1, "The Voyage Begins"),
+        PopulousMission("Katara's Voyage", 2, "Separated"),
+        PopulousMission("Katara's Voyage", 3, "Preacher Panic"),
+        PopulousMission("Katara's Voyage", 4, "Surrounded By Rivals"),
+        PopulousMission("Katara's Voyage", 5, "Icy Madness"),
+        PopulousMission("Katara's Voyage", 6, "Facing Worlds"),
+        PopulousMission("Katara's Voyage", 7, "Dakini's Prison", is_gimmick=True),
+        PopulousMission("Katara's Voyage", 8, "Air Temple of Death"),
+        PopulousMission("Katara's Voyage", 9, "Azula's Stronghold"),
+        PopulousMission("Katara's Voyage", 10, "End of the Line"),
+
+        PopulousMission("Ascension", 1, "Descendants"),
+        PopulousMission("Ascension", 2, "A New Journey"),
+        PopulousMission("Ascension", 3, "Distress Signal"),
+        PopulousMission("Ascension", 4, "Prisoners of War", is_gimmick=True),
+        PopulousMission("Ascension", 5, "Zealots"),
+        PopulousMission("Ascension", 6, "Trials of Blood", is_gimmick=True),
+        PopulousMission("Ascension", 7, "The Gift Of Flames"),
+        PopulousMission("Ascension", 8, "Diverting Enemies"),
+        PopulousMission("Ascension", 9, "Tyranny"),
+        PopulousMission("Ascension", 10, "Civil War"),
+
+        PopulousMission("The Witching Hour", 2, "The Witching Hour", is_gimmick=True),
+        PopulousMission("The Witching Hour", 3, "Great Indian Desert"),
+        PopulousMission("The Witching Hour", 4, "Death on the Nile"),
+        PopulousMission("The Witching Hour", 5, "Beaks of the Beast", is_gimmick=True),
+        PopulousMission("The Witching Hour", 6, "Crimson Graveyard"),
+        PopulousMission("The Witching Hour", 7, "Memento Mori", is_gimmick=True),
+        PopulousMission("The Witching Hour", 8, "The Instructor"),
+        PopulousMission("The Witching Hour", 9, "Brainlust"),
+        PopulousMission("The Witching Hour", 10, "Glacial Prison"),
+        PopulousMission("The Witching Hour", 11, "Looking for Answers", is_gimmick=True),
+        PopulousMission("The Witching Hour", 12, "Book of the Dead"),
+        PopulousMission("The Witching Hour", 13, "Avernus"),
+        PopulousMission("The Witching Hour", 14, "We're Not Alone"),
+        PopulousMission("The Witching Hour", 15, "Witches' Sabbath"),
+        PopulousMission("The Witching Hour", 16, "Death's Denial", is_gimmick=True),
+
+        PopulousMission("The Devil System C1", 1, "The Exploration Begins"),
+        PopulousMission("The Devil System C1", 2, "Power of Faith"),
+        PopulousMission("The Devil System C1", 3, "Matak Attack"),
+        PopulousMission("The Devil System C1", 4, "Lightning Eel"),
+        PopulousMission("The Devil System C1", 6, "Two On Four"),
+        PopulousMission("The Devil System C1", 7, "Land of the Wilds"),
+        PopulousMission("The Devil System C1", 8, "The Legend of Kikikini"),
+        PopulousMission("The Devil System C1", 9, "Help From Nowhere"),
+        PopulousMission("The Devil System C1", 11, "Teamwork Forever"),
+        PopulousMission("The Devil System C1", 12, "Sabotage"),
+        PopulousMission("The Devil System C1", 13, "The Traitor"),
+        PopulousMission("The Devil System C1", 14, "Allies Torn Apart"),
+        PopulousMission("The Devil System C1", 15, "Taitaki's Introduction"),
+        PopulousMission("The Devil System C1", 16, "Evil Land"),
+        PopulousMission("The Devil System C1", 17, "Cold Welcome", is_gimmick=True),
+        PopulousMission("The Devil System C1", 18, "Great Wall of Ice"),
+        PopulousMission("The Devil System C1", 19, "Wrath of the God", is_gimmick=True),
+        PopulousMission("The Devil System C1", 20, "Harsh Climates"),
+        PopulousMission("The Devil System C1", 21, "Magical Protection"),
+        PopulousMission("The Devil System C1", 22, "Frozen Seas"),
+        PopulousMission("The Devil System C1", 23, "Hypnotic Menace"),
+        PopulousMission("The Devil System C1", 24, "Tribal Time Bomb"),
+        PopulousMission("The Devil System C1", 25, "Rupture", is_gimmick=True),
+        PopulousMission("The Devil System C1", 26, "Rubble Pile"),
+        PopulousMission("The Devil System C1", 27, "Contract Binaries"),
+        PopulousMission("The Devil System C1", 28, "Eternal Rain of Fire"),
+
+        PopulousMission("Seasons: Spring", 1, "Help on the Way"),
+        PopulousMission("Seasons: Spring", 2, "Tribal Ascend"),
+        PopulousMission("Seasons: Spring", 3, "One for the Team", is_gimmick=True),
+        PopulousMission("Seasons: Spring", 4, "Arrival"),
+        PopulousMission("Seasons: Spring", 5, "The Conjuring"),
+        PopulousMission("Seasons: Spring", 6, "Divided Attention"),
+        PopulousMission("Seasons: Spring", 7, "Through Fear", is_gimmick=True),
+        PopulousMission("Seasons: Spring", 8, "The Bard's Tale"),
+        PopulousMission("Seasons: Spring", 9, "Supercell Torture"),
+        PopulousMission("Seasons: Spring", 10, "Hollow Canyon"),
+        PopulousMission("Seasons: Spring", 11, "Eastern Winds"),
+        PopulousMission("Seasons: Spring", 12, "Where Shamans Fall"),
+
+        PopulousMission("Seasons: Summer", 1, "Ring of Fire"),
+        PopulousMission("Seasons: Summer", 2, "A Midsummer Twilight", is_gimmick=True),
+        PopulousMission("Seasons: Summer", 3, "Clouded Warfare"),
+        PopulousMission("Seasons: Summer", 4, "Sunny Morning"),
+        PopulousMission("Seasons: Summer", 5, "Bouncin' Eight"),
+        PopulousMission("Seasons: Summer", 6, "Build'N'Conquer"),
+        PopulousMission("Seasons: Summer", 7, "Mirage"),
+        PopulousMission("Seasons: Summer", 8, "Southern Winds", is_gimmick=True),
+
+        PopulousMission("Seasons: Autumn", 1, "Wind Howling"),
+        PopulousMission("Seasons: Autumn", 2, "Far Steppe"),
+        PopulousMission("Seasons: Autumn", 3, "44 Days", is_gimmick=True),
+        PopulousMission("Seasons: Autumn", 4, "The Bitter End"),
+        PopulousMission("Seasons: Autumn", 5, "Chartreuse"),
+        PopulousMission("Seasons: Autumn", 6, "Redleaf Battle"),
+        PopulousMission("Seasons: Autumn", 7, "The Priest's Escort", is_gimmick=True),
+        PopulousMission("Seasons: Autumn", 8, "Western Winds"),
+        PopulousMission("Seasons: Autumn", 9, "Torn Into Shreds"),
+        PopulousMission("Seasons: Autumn", 10, "The Healer Skulks"),
+        PopulousMission("Seasons: Autumn", 11, "Message For the Chumara"),
+        PopulousMission("Seasons: Autumn", 12, "From the Shadows"),
+
+        PopulousMission("Seasons: Winter", 1, "It's Friday"),
+        PopulousMission("Seasons: Winter", 2, "Time Has Come"),
+        PopulousMission("Seasons: Winter", 3, "The Rift"),
+        PopulousMission("Seasons: Winter", 4, "Meltdown"),
+        PopulousMission("Seasons: Winter", 5, "High Issues"),
+        PopulousMission("Seasons: Winter", 6, "Thaw on the Mountains"),
+        PopulousMission("Seasons: Winter", 7, "Power of Two", is_gimmick=True),
+        PopulousMission("Seasons: Winter", 8, "Frozen Fruit"),
+        PopulousMission("Seasons: Winter", 9, "Northern Winds", is_gimmick=True),
+        PopulousMission("Seasons: Winter", 10, "Shattered Ice"),
+        PopulousMission("Seasons: Winter", 11, "Pirate Isles"),
+        PopulousMission("Seasons: Winter", 12, "Snonado"),
+
+        PopulousMission("War of the Gods", 1, "Erecting Paths"),
+        PopulousMission("War of the Gods", 2, "Hornet Nest"),
+        PopulousMission("War of the Gods", 3, "Cursed Faith"),
+        PopulousMission("War of the Gods", 4, "Triforce of Storms"),
+        PopulousMission("War of the Gods", 5, "Black Death", is_gimmick=True),
+        PopulousMission("War of the Gods", 6, "Supernatural Voodoo"),
+        PopulousMission("War of the Gods", 7, "Inconspicious Odds"),
+        PopulousMission("War of the Gods", 8, "Intercontinental Split"),
+        PopulousMission("War of the Gods", 9, "Obscured From The Flow"),
+        PopulousMission("War of the Gods", 10, "A Sinking Feeling", is_gimmick=True),
+        PopulousMission("War of the Gods", 11, "Perilous Spirits"),
+        PopulousMission("War of the Gods", 12, "A Pushover Decision"),
+        PopulousMission("War of the Gods", 13, "Ethereal Onslaught"),
+        PopulousMission("War of the Gods", 14, "Ambush Assault"),
+        PopulousMission("War of the Gods", 15, "Detained", is_gimmick=True),
+        PopulousMission("War of the Gods", 16, "Bloodthirsty"),
+        PopulousMission("War of the Gods", 17, "Center Field"),
+        PopulousMission("War of the Gods", 18, "Top Stalker"),
+        PopulousMission("War of the Gods", 19, "Absurd Partners"),
+        PopulousMission("War of the Gods", 20, "Demon's Flight"),
+        PopulousMission("War of the Gods", 21, "Ruptured World"),
+        PopulousMission("War of the Gods", 22, "Stranded", is_gimmick=True),
+        PopulousMission("War of the Gods", 23, "Hellfire"),
+        PopulousMission("War of the Gods", 24, "A Mortal's End"),
+        PopulousMission("War of the Gods", 25, "War of the Gods", is_gimmick=True),
+
+        PopulousMission("Adaptive AI", 1, "SMP Roots"),
+        PopulousMission("Adaptive AI", 2, "Mandala"),
+        PopulousMission("Adaptive AI", 3, "Persimmon"),
+        PopulousMission("Adaptive AI", 4, "Wasteland"),
+        PopulousMission("Adaptive AI", 5, "Fortresses"),
+        PopulousMission("Adaptive AI", 6, "Airstrike"),
+        PopulousMission("Adaptive AI", 7, "Bloodlust"),
+        PopulousMission("Adaptive AI", 8, "Blackout"),
+        PopulousMission("Adaptive AI", 9, "Teleport Trickery"),
+        PopulousMission("Adaptive AI", 10, "Calamity"),
+        PopulousMission("Adaptive AI", 11, "Betrayal"),
+        PopulousMission("Adaptive AI", 12, "Natural Disasters"),
+        PopulousMission("Adaptive AI", 13, "Empowerment"),
+        PopulousMission("Adaptive AI", 14, "Chosen Restrictions"),
+        PopulousMission("Adaptive AI", 15, "Ring Islands"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def mission_catalog() -> MissionCatalog:
+    missions: Tuple[PopulousMission, ...] = load_missions()
+
+    by_campaign: Dict[str, Tuple[PopulousMission, ...]] = {
+        campaign: tuple(mission for mission in missions if mission.campaign == campaign)
+        for campaign in dict.fromkeys(mission.campaign for mission in missions)
+    }
+
+    catalog: MissionCatalog = MissionCatalog(
+        missions=missions,
+        by_campaign=by_campaign,
+        by_gimmick={
+            is_gimmick: tuple(mission for mission in missions if mission.is_gimmick == is_gimmick)
+            for is_gimmick in (False, True)
+        },
+        label_ids={
+            (campaign, is_gimmick): STRINGS.intern_all(
+                mission.label for mission in campaign_missions if mission.is_gimmick == is_gimmick
+            )
+            for campaign, campaign_missions in by_campaign.items()
+            for is_gimmick in (False, True)
+        },
+        supporting={
+            name: {
+                value: frozenset(
+                    STRINGS.intern(mission.label) for mission in missions
+                    if getattr(mission, field) is None or value in getattr(mission, field)
+                )
+                for value in getattr(PopulousTheBeginningGame, name)()
+            }
+            for name, field in MISSION_REQUIREMENTS.items()
+        },
+        estimates={
+            STRINGS.intern(mission.label): estimate_mission(
+                mission, max(other.number for other in by_campaign[mission.campaign])
+            )
+            for mission in missions
+        },
+    )
+
+    validate_catalog(catalog)
+
+    return catalog
+
+
+def __getattr__(name: str) -> Any:
+    if name == "MISSIONS":
+        return mission_catalog().missions
+    elif name == "MISSIONS_BY_CAMPAIGN":
+        return mission_catalog().by_campaign
+    elif name == "MISSIONS_BY_GIMMICK":
+        return mission_catalog().by_gimmick
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def resolve_option_mask(campaigns: Iterable[str], gimmicks: Iterable[str]) -> int:
+    mask: int = 0
+
+    for key in campaigns:
+        mask |= CAMPAIGN_BITS.get(key, 0)
+
+    if "Gimmicks On" in gimmicks:
+        mask |= GIMMICK_BIT
+
+    return mask
+
+
+def build_planet_pool_ids(mask: int) -> Tuple[int, ...]:
+    gimmicks: bool = bool(mask & GIMMICK_BIT)
+
+    selected: List[str] = [BASE_CAMPAIGN]
+    selected.extend(
+        CAMPAIGNS_BY_OPTION[key] for key, bit in CAMPAIGN_BITS.items() if mask & bit and key in CAMPAIGNS_BY_OPTION
+    )
+
+    label_ids: Dict[Tuple[str, bool], Tuple[int, ...]] = mission_catalog().label_ids
+
+    planets: Set[int] = set()
+
+    for campaign in selected:
+        planets.update(label_ids[(campaign, False)])
+
+        if gimmicks:
+            planets.update(label_ids[(campaign, True)])
+
+    return STRINGS.sorted(planets)
+
+
+def build_planet_pool(mask: int) -> Tuple[str, ...]:
+    return STRINGS.texts(build_planet_pool_ids(mask))
+
+
+# Set by warm_start() so pools are read from a shared snapshot instead of being rebuilt from the catalog
+_pool_snapshot: Optional[PoolSnapshot] = None
+
+
+@functools.lru_cache(maxsize=None)
+def planet_pool_ids(mask: int) -> Tuple[int, ...]:
+    if _pool_snapshot is not None:
+        pool_ids: Optional[Tuple[int, ...]] = _pool_snapshot.pool_ids(mask)
+
+        if pool_ids is not None:
+            return pool_ids
+
+    return build_planet_pool_ids(mask)
+
+
+# Shared by every game instance: the pool only depends on the option mask
+@functools.lru_cache(maxsize=None)
+def planet_pool(mask: int) -> Tuple[str, ...]:
+    if _pool_snapshot is not None:
+        pool: Optional[Tuple[str, ...]] = _pool_snapshot.pool(mask)
+
+        if pool is not None:
+            return pool
+
+    return STRINGS.texts(planet_pool_ids(mask))
+
+
+# Entries of a static pool that at least one mission in the planet pool supports
+def build_supported_pool(mask: int, name: str) -> Tuple[str, ...]:
+    planets: FrozenSet[int] = frozenset(build_planet_pool_ids(mask))
+    supporting: Dict[str, FrozenSet[int]] = mission_catalog().supporting[name]
+
+    return tuple(
+        value for value in getattr(PopulousTheBeginningGame, name)() if not planets.isdisjoint(supporting[value])
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def supported_pool(mask: int, name: str) -> Tuple[str, ...]:
+    if _pool_snapshot is not None:
+        pool: Optional[Tuple[str, ...]] = _pool_snapshot.supported_pool(mask, name)
+
+        if pool is not None:
+            return pool
+
+    return build_supported_pool(mask, name)
+
+
+def mission_estimates() -> Dict[int, MissionEstimate]:
+    return _pool_snapshot.estimates if _pool_snapshot is not None else mission_catalog().estimates
+
+
+class PlanetBudget(NamedTuple):
+    planets: Tuple[str, ...]
+
+    # Sum of the modelled estimates from estimate_mission(), not measured play time
+    minutes: int
+
+
+def pack_planets(
+    mask: int,
+    budget_minutes: int,
+    seed: int,
+    max_difficulty: int = 5,
+) -> PlanetBudget:
+    # A budget below zero fits nothing, and would otherwise make the shift below negative
+    if budget_minutes < 0:
+        return PlanetBudget(planets=tuple(), minutes=0)
+
+    estimates: Dict[int, MissionEstimate] = mission_estimates()
+
+    candidates: List[int] = [
+        string_id for string_id in planet_pool_ids(mask)
+        if estimates[string_id].difficulty <= max_difficulty and estimates[string_id].minutes <= budget_minutes
+    ]
+
+    # Shuffled so each seed packs a different selection among equally good ones
+    Random(seed).shuffle(candidates)
+
+    # The bitset below has one bit per minute, so it is sized to what the candidates can reach at most
+    budget_minutes = min(budget_minutes, sum(estimates[string_id].minutes for string_id in candidates))
+
+    # Subset-sum over minutes: bit m of reachable[i] is set when m minutes can be made from the first i candidates
+    limit: int = (1 << (budget_minutes + 1)) - 1
+    reachable: List[int] = [1]
+
+    for string_id in candidates:
+        reachable.append((reachable[-1] | reachable[-1] << estimates[string_id].minutes) & limit)
+
+    minutes: int = reachable[-1].bit_length() - 1
+    remaining: int = minutes
+
+    selected: List[int] = list()
+
+    for index in range(len(candidates) - 1, -1, -1):
+        if not reachable[index] >> remaining & 1:
+            selected.append(candidates[index])
+            remaining -= estimates[candidates[index]].minutes
+
+    return PlanetBudget(planets=STRINGS.texts(STRINGS.sorted(selected)), minutes=minutes)
+
+
+def precompute_planet_pools() -> None:
+    for mask in range(OPTION_MASK_COUNT):
+        planet_pool(mask)
+
+
+class PlanetPoolChange(NamedTuple):
+    mask: int
+    added: Tuple[str, ...]
+    removed: Tuple[str, ...]
+
+
+class PlanetPool:
+    mask: Optional[int]
+    labels: List[str]
+    listeners: List[Callable[[PlanetPoolChange], None]]
+
+    def __init__(self, mask: int = 0) -> None:
+        self.mask = None
+        self.labels = list()
+        self.listeners = list()
+
+        self.update(mask)
+
+    @property
+    def planets(self) -> Tuple[str, ...]:
+        return tuple(self.labels)
+
+    def subscribe(self, listener: Callable[[PlanetPoolChange], None]) -> None:
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[PlanetPoolChange], None]) -> None:
+        self.listeners.remove(listener)
+
+    def set_campaign(self, key: str, enabled: bool) -> None:
+        bit: int = CAMPAIGN_BITS[key]
+        self.update(self.mask | bit if enabled else self.mask & ~bit)
+
+    def set_gimmicks(self, enabled: bool) -> None:
+        self.update(self.mask | GIMMICK_BIT if enabled else self.mask & ~GIMMICK_BIT)
+
+    def update(self, mask: int) -> None:
+        if mask == self.mask:
+            return
+
+        label_ids: Dict[Tuple[str, bool], Tuple[int, ...]] = mission_catalog().label_ids
+
+        # The base campaign has no option bit and is always selected
+        campaigns: List[Tuple[str, int]] = [(BASE_CAMPAIGN, 0)]
+        campaigns.extend((CAMPAIGNS_BY_OPTION[key], bit) for key, bit in CAMPAIGN_BITS.items())
+
+        added: List[str] = list()
+        removed: List[str] = list()
+
+        for campaign, bit in campaigns:
+            for is_gimmick in (False, True):
+                required: int = bit | (GIMMICK_BIT if is_gimmick else 0)
+
+                was_selected: bool = self.mask is not None and self.mask & required == required
+                is_selected: bool = mask & required == required
+
+                if was_selected and not is_selected:
+                    removed.extend(STRINGS.texts(label_ids[(campaign, is_gimmick)]))
+                elif is_selected and not was_selected:
+                    added.extend(STRINGS.texts(label_ids[(campaign, is_gimmick)]))
+
+        for label in removed:
+            del self.labels[bisect.bisect_left(self.labels, label)]
+
+        for label in added:
+            bisect.insort(self.labels, label)
+
+        self.mask = mask
+
+        change: PlanetPoolChange = PlanetPoolChange(mask=mask, added=tuple(added), removed=tuple(removed))
+
+        for listener in self.listeners:
+            listener(change)
+
+
+def validate_catalog(catalog: MissionCatalog) -> None:
+    issues: List[str] = list()
+
+    valid_keys: List[str] = PopulousTBCommunityMissions.valid_keys
+
+    for key in CAMPAIGNS_BY_OPTION:
+        if key not in valid_keys:
+            issues.append(f"Campaign option key '{key}' is not one of PopulousTBCommunityMissions.valid_keys")
+
+    for key in valid_keys:
+        if key not in CAMPAIGNS_BY_OPTION:
+            issues.append(f"PopulousTBCommunityMissions key '{key}' does not select any campaign")
+        elif CAMPAIGNS_BY_OPTION[key] not in catalog.by_campaign:
+            issues.append(f"PopulousTBCommunityMissions key '{key}' selects a campaign without missions")
+
+    if "Gimmicks On" not in PopulousTBGimmickMissions.valid_keys:
+        issues.append("PopulousTBGimmickMissions has no 'Gimmicks On' key")
+
+    seen: Dict[Tuple[str, int], PopulousMission] = dict()
+
+    for mission in catalog.missions:
+        key: Tuple[str, int] = (mission.campaign, mission.number)
+
+        if key in seen:
+            issues.append(f"Mission '{mission.label}' is listed more than once")
+
+        seen[key] = mission
+
+    pools: Dict[str, Tuple[str, ...]] = {
+        "easychallenge": PopulousTheBeginningGame.easychallenge(),
+        "mediumchallenge": PopulousTheBeginningGame.mediumchallenge(),
+        "hardchallenge": PopulousTheBeginningGame.hardchallenge(),
+        "buildables": PopulousTheBeginningGame.buildables(),
+        "tribe": PopulousTheBeginningGame.tribe(),
+        "spells": PopulousTheBeginningGame.spells(),
+        "idols": PopulousTheBeginningGame.idols(),
+    }
+
+    for name, pool in pools.items():
+        for entry in sorted(set(entry for entry in pool if pool.count(entry) > 1)):
+            issues.append(f"'{entry}' is listed more than once in {name}()")
+
+    for name, field in MISSION_REQUIREMENTS.items():
+        for mission in catalog.missions:
+            for value in sorted(set(getattr(mission, field) or ()) - set(pools[name])):
+                issues.append(f"Mission '{mission.label}' lists {field} '{value}' which is not in {name}()")
+
+    if issues:
+        raise PopulousCatalogError(issues)
+
+
+# Static pools are shared tuples so every call returns the same object
+EASY_CHALLENGES: Tuple[str, ...] = (
+    "Complete a Planet without worshipping anything",
+    "Complete a Planet where you eliminate the Dakini Tribe last",
+    "Complete a Planet where you eliminate the Chumara Tribe last",
+    "Complete a Planet where you eliminate the Matak Tribe last",
+    "Complete a Planet where all three Tribes are present",
+    "Complete a Planet with only one enemy Tribe present",
+    "Have 10 fully-built Guard Towers at once",
+    "Have 5 Warrior Training Huts at once",
+    "Have 5 Temples at once",
+    "Have 5 Firewarrior or Archer Training Huts at once",
+    "Convert an enemy Warrior with one of your Preachers",
+    "Convert an enemy Firewarrior or Archer with one of your Preachers",
+    "Kill an enemy Shaman by knocking them into water",
+    "Use Call to Arms to defeat an enemy attack (Press B when a Warrior in a Guard Tower sees an enemy)",
+    "Scare an enemy Shaman out of her Guard Tower using Swarm or Spies",
+    "Kill an enemy that is in the process of worshipping",
+    "Use the Lightning Bolt spell on an enemy Training Hut",
+    "Conceal all of your buildings from worldview by using Spies in Guard Towers",
+    "Destroy an enemy Warrior Training Hut",
+    "Destroy an enemy Temple",
+    "Destroy an enemy Firewarrior Training Hut",
+    "Destroy an enemy Spy Training Hut",
+    "Destroy an enemy Boat House",
+    "Destroy an enemy Balloon Hut",
+    "On any planet, have one charge of every available spell",
+    "Complete a planet without your Shaman dying",
+)
+
+MEDIUM_CHALLENGES: Tuple[str, ...] = (
+    "Have 20 Large Huts at once",
+    "Complete a Planet without training any Warriors",
+    "Complete a Planet without training any Firewarriors or Archers",
+    "Complete a Planet without training any Preachers",
+    "Complete a Planet without making any vehicles",
+    "Complete a Planet without putting any Firewarriors or Archers into Guard Towers",
+    "Complete a Planet without using any patrol points or campfires",
+    "Complete a Planet without using the Blast spell",
+    "Complete a Planet without using the Convert spell",
+    "Complete a Planet without using Landbridge, Flatten or Erode",
+    "Successfully sabotage 5 buildings with Spies in a single Planet",
+    "Have at least 200 followers at once",
+    "Eliminate a tribe without ever damaging their buildings with your Shaman and her spells",
+    "Eliminate a tribe with only your Shaman and her spells",
+    "Complete a planet where you built your base far away from your reincarnation site",
+    "Have 50 Warriors at once",
+    "Have 50 Preachers at once",
+    "Have 50 Firewarriors and/or Archers at once",
+    "Complete a Planet where you have an ally",
+    "Have 25 followers in Boats at once",
+    "Have 10 followers in Balloons at once",
+    "Have a Large Hut containing a Brave, Warrior, Preacher, Firewarrior and Spy",
+    "Create a pile of at least 30 Wood",
+    "Obtain one of the three Guest Spells: Bloodlust, Teleport or Armageddon",
+)
+
+HARD_CHALLENGES: Tuple[str, ...] = (
+    "Complete a Planet without any of your buildings being completely destroyed",
+    "Complete a Planet without using any building-destroying spells",
+    "Complete a Planet without ever casting a spell on an enemy Shaman",
+    "Have at least 100 followers at once without having any Braves",
+    "Kill an enemy tribe's Angel of Death",
+    "Successfully defeat three tribes in Armageddon",
+    "Completely destroy an enemy Training Hut/Temple by burning it with Spies",
+    "Complete a Planet where enemies are allied against you",
+    "Destroy an enemy structure using the Landbridge spell",
+    "Convert an enemy using a Hypnotized Preacher",
+    "Train a Hypnotized enemy in one of your Training Huts",
+    "Kill a non-brave Enemy in a vehicle with a Firewarrior in a vehicle",
+    "Have one of every Training Hut and Vehicle Hut at the same time",
+    "Have the maximum charges for Blast, Firestorm, Earthquake and Volcano at the same time",
+    "Have the maximum charges for Landbridge, Flatten, Swamp and Erode at the same time",
+    "Have the maximum charges for Convert, Invisibility, Magical Shield and Hypnotize at the same time",
+    "Eliminate a tribe without completely destroying any of their buildings",
+    "Complete a Planet where an enemy tribe was eliminated by a tribe other than you",
+    "Complete a Planet where your Shaman commanded her followers from a Guard Tower that she never left",
+)
+
+BUILDABLES: Tuple[str, ...] = (
+    "Boats",
+    "Balloons",
+)
+
+TRIBES: Tuple[str, ...] = (
+    "Matak",
+    "Chumara",
+    "Dakini",
+)
+
+SPELLS: Tuple[str, ...] = (
+    "Angel of Death",
+    "Blast",
+    "Convert",
+    "Earthquake",
+    "Erode",
+    "Firestorm",
+    "Flatten",
+    "Hypnotise",
+    "Invisibility",
+    "Landbridge",
+    "Lightning",
+    "Magical Shield",
+    "Swamp",
+    "Swarm",
+    "Tornado",
+    "Volcano",
+)
+
+IDOLS: Tuple[str, ...] = (
+    "Stone Head",
+    "Totem Pole",
+    "Vault of Knowledge",
+    "Obelisk, Gargoyle or Portal",
+)
+
+
 class PopulousTheBeginningGame(Game):
     name = "Populous 3: The Beginning"
     platform = KeymastersKeepGamePlatforms.PC
@@ -31,102 +888,48 @@ class PopulousTheBeginningGame(Game):
 
     options_cls = PopulousTheBeginningArchipelagoOptions
 
+    @classmethod
+    def planet_pool_cache_info(cls) -> PlanetPoolCacheInfo:
+        info = planet_pool.cache_info()
+        return PlanetPoolCacheInfo(hits=info.hits, misses=info.misses, currsize=info.currsize)
+
+    @classmethod
+    def planet_pool_cache_clear(cls) -> None:
+        planet_pool.cache_clear()
+
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
         return list()
 
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return [
-            GameObjectiveTemplate(
-                label="Complete PLANETS",
-                data={
-                    "PLANETS": (self.planets, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="EASYCHALLENGE",
-                data={
-                    "EASYCHALLENGE": (self.easychallenge, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-
-            GameObjectiveTemplate(
-                label="MEDIUMCHALLENGE",
-                data={
-                    "MEDIUMCHALLENGE": (self.mediumchallenge, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-
-            GameObjectiveTemplate(
-                label="HARDCHALLENGE",
-                data={
-                    "HARDCHALLENGE": (self.hardchallenge, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=True,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Kill a TRIBE Shaman on any planet",
-                data={
-                    "TRIBE": (self.tribe, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Destroy the TRIBE Tribe on any planet",
-                data={
-                    "TRIBE": (self.tribe, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Charge and use the SPELLS spell on any planet",
-                data={
-                    "SPELLS": (self.spells, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Have 10 BUILDABLES at once on any planet",
-                data={
-                    "BUILDABLES": (self.buildables, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Fully worship a IDOLS on any planet",
-                data={
-                    "IDOLS": (self.idols, 1),
-                },
-                is_time_consuming=False,
-                is_difficult=False,
-                weight=10,
-            ),
-            GameObjectiveTemplate(
-                label="Complete a Planet in 30 minutes or less",
-                data=dict(),
-                is_time_consuming=True,
-                is_difficult=False,
-                weight=10,
-            ),
-        ]
+        return list(objective_templates(self.option_mask))
+
+    def sample_objectives(self, seed: int, count: int) -> List[str]:
+        return objective_sampler(
+            self.option_mask,
+            self.include_difficult_objectives,
+            self.include_time_consuming_objectives,
+        ).sample(seed, count)
+
+    def sample_compatible_objectives(self, seed: int, count: int) -> List[str]:
+        return objective_sampler(
+            self.option_mask,
+            self.include_difficult_objectives,
+            self.include_time_consuming_objectives,
+        ).sample_compatible(seed, count)
+
+    def sample_slot_objectives(self, seed: int, slot: int, count: int) -> List[str]:
+        return objective_sampler(
+            self.option_mask,
+            self.include_difficult_objectives,
+            self.include_time_consuming_objectives,
+        ).sample_slot(seed, slot, count)
+
+    def iter_objectives(self, seed: int, count: Optional[int] = None) -> Iterator[str]:
+        return objective_sampler(
+            self.option_mask,
+            self.include_difficult_objectives,
+            self.include_time_consuming_objectives,
+        ).iter_objectives(seed, count)
 
     @property
     def gimmicks(self) -> List[str]:
@@ -134,603 +937,1610 @@ class PopulousTheBeginningGame(Game):
 
     @property
     def hasgimmicks(self) -> bool:
-        return "Gimmicks On" in self.gimmicks
+        return bool(self.option_mask & GIMMICK_BIT)
 
     @property
     def campaigns(self) -> List[str]:
         return sorted(self.archipelago_options.poptb_campaigns.value)
 
+    # Cached against the option values it was resolved from, so option editors can still change
+    # archipelago_options on a live instance
     @property
-    def hasundiscovered(self) -> List[str]:
-        return "Undiscovered Worlds" in self.campaigns
+    def option_mask(self) -> int:
+        campaigns: Set[str] = self.archipelago_options.poptb_campaigns.value
+        gimmicks: Set[str] = self.archipelago_options.poptb_gimmicks.value
+
+        cached: Optional[Tuple[FrozenSet[str], FrozenSet[str], int]] = getattr(self, "_option_mask_cache", None)
+
+        if cached is not None and cached[0] == campaigns and cached[1] == gimmicks:
+            return cached[2]
+
+        mask: int = resolve_option_mask(campaigns, gimmicks)
+        self._option_mask_cache = (frozenset(campaigns), frozenset(gimmicks), mask)
+
+        return mask
+
+    @property
+    def hasundiscovered(self) -> bool:
+        return bool(self.option_mask & CAMPAIGN_BITS["Undiscovered Worlds"])
 
     @property
     def hastikals(self) -> bool:
-        return "Tikals Journey" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Tikals Journey"])
 
     @property
     def haskatarasvoyage(self) -> bool:
-        return "Kataras Voyage" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Kataras Voyage"])
 
     @property
     def hasascensionc1(self) -> bool:
-        return "Ascension Chapter 1" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Ascension Chapter 1"])
 
     @property
     def haswitchinghour(self) -> bool:
-        return "The Witching Hour" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["The Witching Hour"])
 
     @property
     def hasdevilsystem(self) -> bool:
-        return "The Devil System Chapter 1" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["The Devil System Chapter 1"])
 
     @property
     def hasseasonspring(self) -> bool:
-        return "Seasons: Spring" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Seasons: Spring"])
 
     @property
     def hasseasonsummer(self) -> bool:
-        return "Seasons: Summer" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Seasons: Summer"])
 
     @property
     def hasseasonautumn(self) -> bool:
-        return "Seasons: Autumn" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Seasons: Fall"])
 
     @property
     def hasseasonwinter(self) -> bool:
-        return "Seasons: Winter" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["Seasons: Winter"])
 
     @property
     def haswarofthegods(self) -> bool:
-        return "War of the Gods" in self.campaigns
+        return bool(self.option_mask & CAMPAIGN_BITS["War of the Gods"])
 
     @property
     def hasadaptiveai(self) -> bool:
-        return "Adaptive AI" in self.campaigns
-
-    @functools.cached_property
-    def basecampaign(self) -> List[str]:
-        return [
-            "The Beginning - 1: The Journey Begins",
-            "The Beginning - 2: Night Falls",
-            "The Beginning - 3: Crisis of Faith",
-            "The Beginning - 4: Combined Forces",
-            "The Beginning - 6: Building Bridges",
-            "The Beginning - 7: Unseen Enemy",
-            "The Beginning - 8: Continental Divide",
-            "The Beginning - 9: Fire in the Mist",
-            "The Beginning - 11: Treacherous Souls",
-            "The Beginning - 12: An Easy Target",
-            "The Beginning - 13: Aerial Bombardment",
-            "The Beginning - 14: Attacked From All Sides",
-            "The Beginning - 16: Bloodlust",
-            "The Beginning - 17: Middle Ground",
-            "The Beginning - 18: Head Hunter",
-            "The Beginning - 19: Unlikely Allies",
-            "The Beginning - 20: Archipelago",
-            "The Beginning - 21: Fractured Earth",
-            "The Beginning - 23: Inferno",
-	    "The Beginning - 24: Journey's End",
-        ]
+        return bool(self.option_mask & CAMPAIGN_BITS["Adaptive AI"])
 
-    def planets(self) -> List[str]:        
-        planets: List[str] = self.basecampaign[:]
-  
-        if self.hasgimmicks:
-            planets.extend(self.vanillagimmickplanets)
+    def planets(self) -> Tuple[str, ...]:
+        return planet_pool(self.option_mask)
 
-        if self.hasundiscovered:
-            planets.extend(self.undiscoveredplanets)
+    def incremental_planet_pool(self) -> PlanetPool:
+        return PlanetPool(self.option_mask)
 
-        if self.hasundiscovered and self.hasgimmicks:
-            planets.extend(self.undiscoveredgimmicks)
+    # Fits planets into the budget using modelled play times (see estimate_mission), so treat it as a rough guide
+    def planets_for_budget(self, seed: int, budget_minutes: int, max_difficulty: int = 5) -> List[str]:
+        budget: PlanetBudget = pack_planets(self.option_mask, budget_minutes, seed, max_difficulty)
+        return [f"Complete {planet}" for planet in budget.planets]
 
-        if self.hastikals:
-            planets.extend(self.tikalplanets)
+    @staticmethod
+    def easychallenge() -> Tuple[str, ...]:
+        return EASY_CHALLENGES
 
-        if self.hastikals and self.hasgimmicks:
-            planets.extend(self.tikalgimmicks)
+    @staticmethod
+    def mediumchallenge() -> Tuple[str, ...]:
+        return MEDIUM_CHALLENGES
 
-        if self.haskatarasvoyage:
-            planets.extend(self.kataraplanets)
+    @staticmethod
+    def hardchallenge() -> Tuple[str, ...]:
+        return HARD_CHALLENGES
 
-        if self.haskatarasvoyage and self.hasgimmicks:
-            planets.extend(self.kataragimmicks)
+    @staticmethod
+    def buildables() -> Tuple[str, ...]:
+        return BUILDABLES
 
-        if self.hasascensionc1:
-            planets.extend(self.ascensionplanets)
+    @staticmethod
+    def tribe() -> Tuple[str, ...]:
+        return TRIBES
 
-        if self.hasascensionc1 and self.hasgimmicks:
-            planets.extend(self.ascensiongimmicks)
+    @staticmethod
+    def spells() -> Tuple[str, ...]:
+        return SPELLS
 
-        if self.haswitchinghour:
-            planets.extend(self.witchplanets)
+    @staticmethod
+    def idols() -> Tuple[str, ...]:
+        return IDOLS
+
+
+def build_objective_templates(mask: int) -> Tuple[FrozenGameObjectiveTemplate, ...]:
+    templates: Tuple[FrozenGameObjectiveTemplate, ...] = (
+        FrozenGameObjectiveTemplate(
+            label="Complete PLANETS",
+            data={
+                "PLANETS": (functools.partial(planet_pool, mask), 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="EASYCHALLENGE",
+            data={
+                "EASYCHALLENGE": (PopulousTheBeginningGame.easychallenge, 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+
+        FrozenGameObjectiveTemplate(
+            label="MEDIUMCHALLENGE",
+            data={
+                "MEDIUMCHALLENGE": (PopulousTheBeginningGame.mediumchallenge, 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+
+        FrozenGameObjectiveTemplate(
+            label="HARDCHALLENGE",
+            data={
+                "HARDCHALLENGE": (PopulousTheBeginningGame.hardchallenge, 1),
+            },
+            is_time_consuming=False,
+            is_difficult=True,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Kill a TRIBE Shaman on any planet",
+            data={
+                "TRIBE": (functools.partial(supported_pool, mask, "tribe"), 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Destroy the TRIBE Tribe on any planet",
+            data={
+                "TRIBE": (functools.partial(supported_pool, mask, "tribe"), 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Charge and use the SPELLS spell on any planet",
+            data={
+                "SPELLS": (functools.partial(supported_pool, mask, "spells"), 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Have 10 BUILDABLES at once on any planet",
+            data={
+                "BUILDABLES": (functools.partial(supported_pool, mask, "buildables"), 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Fully worship a IDOLS on any planet",
+            data={
+                "IDOLS": (PopulousTheBeginningGame.idols, 1),
+            },
+            is_time_consuming=False,
+            is_difficult=False,
+            weight=10,
+        ),
+        FrozenGameObjectiveTemplate(
+            label="Complete a Planet in 30 minutes or less",
+            data=dict(),
+            is_time_consuming=True,
+            is_difficult=False,
+            weight=10,
+        ),
+    )
+
+    # A template whose pools no enabled planet can satisfy is left out entirely
+    return tuple(
+        template for template in templates
+        if all(len(collection()) >= (min(quantity) if isinstance(quantity, range) else quantity)
+               for collection, quantity in template.data.values())
+    )
+
+
+# Shared by every game instance with the same option mask, hence frozen
+@functools.lru_cache(maxsize=None)
+def objective_templates(mask: int) -> Tuple[FrozenGameObjectiveTemplate, ...]:
+    return build_objective_templates(mask)
+
+
+# Pool entries that contradict each other when they end up in the same keep
+CONFLICTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "Complete a Planet without using the Blast spell",
+        (
+            "Blast",
+            "Have the maximum charges for Blast, Firestorm, Earthquake and Volcano at the same time",
+        ),
+    ),
+    (
+        "Complete a Planet without using the Convert spell",
+        (
+            "Convert",
+            "Have the maximum charges for Convert, Invisibility, Magical Shield and Hypnotize at the same time",
+        ),
+    ),
+    (
+        "Complete a Planet without using Landbridge, Flatten or Erode",
+        (
+            "Landbridge",
+            "Flatten",
+            "Erode",
+            "Destroy an enemy structure using the Landbridge spell",
+            "Have the maximum charges for Landbridge, Flatten, Swamp and Erode at the same time",
+        ),
+    ),
+    (
+        "Complete a Planet without using any building-destroying spells",
+        (
+            "Use the Lightning Bolt spell on an enemy Training Hut",
+            "Destroy an enemy structure using the Landbridge spell",
+        ),
+    ),
+    (
+        "Complete a Planet without making any vehicles",
+        (
+            "Boats",
+            "Balloons",
+            "Have 25 followers in Boats at once",
+            "Have 10 followers in Balloons at once",
+            "Kill a non-brave Enemy in a vehicle with a Firewarrior in a vehicle",
+            "Have one of every Training Hut and Vehicle Hut at the same time",
+        ),
+    ),
+    (
+        "Complete a Planet without training any Warriors",
+        (
+            "Have 50 Warriors at once",
+            "Have a Large Hut containing a Brave, Warrior, Preacher, Firewarrior and Spy",
+        ),
+    ),
+    (
+        "Complete a Planet without training any Firewarriors or Archers",
+        (
+            "Have 50 Firewarriors and/or Archers at once",
+            "Have a Large Hut containing a Brave, Warrior, Preacher, Firewarrior and Spy",
+            "Kill a non-brave Enemy in a vehicle with a Firewarrior in a vehicle",
+        ),
+    ),
+    (
+        "Complete a Planet without training any Preachers",
+        (
+            "Have 50 Preachers at once",
+            "Have a Large Hut containing a Brave, Warrior, Preacher, Firewarrior and Spy",
+            "Convert an enemy Warrior with one of your Preachers",
+            "Convert an enemy Firewarrior or Archer with one of your Preachers",
+        ),
+    ),
+    (
+        "Complete a Planet with only one enemy Tribe present",
+        (
+            "Complete a Planet where all three Tribes are present",
+            "Complete a Planet where you eliminate the Dakini Tribe last",
+            "Complete a Planet where you eliminate the Chumara Tribe last",
+            "Complete a Planet where you eliminate the Matak Tribe last",
+            "Complete a Planet where enemies are allied against you",
+            "Complete a Planet where an enemy tribe was eliminated by a tribe other than you",
+        ),
+    ),
+)
 
-        if self.haswitchinghour and self.hasgimmicks:
-            planets.extend(self.witchgimmicks)
 
-        if self.hasdevilsystem:
-            planets.extend(self.devilsystemplanets)
+@functools.lru_cache(maxsize=None)
+def conflict_index() -> Dict[int, FrozenSet[int]]:
+    known: Set[str] = set()
 
-        if self.hasdevilsystem and self.hasgimmicks:
-            planets.extend(self.devilgimmicks)
+    for name in ("easychallenge", "mediumchallenge", "hardchallenge", "buildables", "tribe", "spells", "idols"):
+        known.update(getattr(PopulousTheBeginningGame, name)())
 
-        if self.hasseasonspring:
-            planets.extend(self.springplanets)
+    issues: List[str] = [
+        f"Conflict entry '{text}' is not in any challenge, spell, tribe, buildable or idol pool"
+        for entry, conflicts in CONFLICTS
+        for text in (entry,) + conflicts
+        if text not in known
+    ]
 
-        if self.hasseasonspring and self.hasgimmicks:
-            planets.extend(self.springgimmicks)
+    if issues:
+        raise PopulousCatalogError(sorted(set(issues)))
 
-        if self.hasseasonsummer:
-            planets.extend(self.summerplanets)
+    index: Dict[int, Set[int]] = dict()
 
-        if self.hasseasonsummer and self.hasgimmicks:
-            planets.extend(self.summergimmicks)
+    for entry, conflicts in CONFLICTS:
+        entry_id: int = STRINGS.intern(entry)
 
-        if self.hasseasonautumn:
-            planets.extend(self.autumnplanets)
+        for conflict_id in STRINGS.intern_all(conflicts):
+            index.setdefault(entry_id, set()).add(conflict_id)
+            index.setdefault(conflict_id, set()).add(entry_id)
 
-        if self.hasseasonautumn and self.hasgimmicks:
-            planets.extend(self.autumngimmicks)
+    return {string_id: frozenset(conflict_ids) for string_id, conflict_ids in index.items()}
 
-        if self.hasseasonwinter:
-            planets.extend(self.winterplanets)
 
-        if self.hasseasonwinter and self.hasgimmicks:
-            planets.extend(self.wintergimmicks)
+class AliasTable:
+    probabilities: Tuple[float, ...]
+    aliases: Tuple[int, ...]
 
-        if self.haswarofthegods:
-            planets.extend(self.warofthegodsplanets)
+    def __init__(self, weights: Sequence[float]) -> None:
+        count: int = len(weights)
+        total: float = sum(weights)
 
-        if self.haswarofthegods and self.hasgimmicks:
-            planets.extend(self.warofthegodsgimmicks)
+        scaled: List[float] = [weight * count / total for weight in weights]
+        probabilities: List[float] = [1.0] * count
+        aliases: List[int] = list(range(count))
 
-        if self.hasadaptiveai:
-            planets.extend(self.adaptiveaiplanets)
+        small: List[int] = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large: List[int] = [index for index, weight in enumerate(scaled) if weight >= 1.0]
 
-        return sorted(planets)
-            
-    @functools.cached_property
-    def vanillagimmickplanets(self) -> List[str]:
-        return [		
-            "The Beginning - 5: Death from Above",            
-            "The Beginning - 10: From the Depths",
-            "The Beginning - 15: Incarcerated",
-            "The Beginning - 22: Solo",
-	    "The Beginning - 25: The Beginning",
-        ]
+        # Vose's method: pair each under-full column with an over-full one
+        while small and large:
+            less: int = small.pop()
+            more: int = large.pop()
 
-    @functools.cached_property
-    def undiscoveredplanets(self) -> List[str]:
-        return [		
-            "Undiscovered Worlds - 1: Aftermath",
-            "Undiscovered Worlds - 2: Lava Flow",
-	    "Undiscovered Worlds - 3: Soul Survivor",
-            "Undiscovered Worlds - 4: World Wide Web",
-            "Undiscovered Worlds - 5: Human Shield",
-            "Undiscovered Worlds - 7: Protection Racket",
-            "Undiscovered Worlds - 9: Overshadowed",
-            "Undiscovered Worlds - 10: Fortress",
-        ]
+            probabilities[less] = scaled[less]
+            aliases[less] = more
 
-    @functools.cached_property
-    def undiscoveredgimmicks(self) -> List[str]:
-        return [		
-            "Undiscovered Worlds - 4: World Wide Web",
-            "Undiscovered Worlds - 6: No Man's Land",
-	    "Undiscovered Worlds - 8: Prisons",
-	    "Undiscovered Worlds - 11: L'Assassine",
-            "Undiscovered Worlds - 12: Natural Disaster",
-        ]
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
 
-    @functools.cached_property
-    def tikalplanets(self) -> List[str]:
-        return [
-		"Tikal's Journey - 1: No Turning Back",
-		"Tikal's Journey - 2: Outnumbered?",
-		"Tikal's Journey - 3: Painful Magic",
-		"Tikal's Journey - 4: Daki-Tak Island",
-		"Tikal's Journey - 5: Hidden In Darkness",
-		"Tikal's Journey - 6: Two For One Deal",
-		"Tikal's Journey - 7: Cyclone Fury",
-		"Tikal's Journey - 8: Helping Hands",
-		"Tikal's Journey - 9: Island Hopping",
-		"Tikal's Journey - 10: Desert Mirage",
-		"Tikal's Journey - 11: War on the Isle",
-		"Tikal's Journey - 12: Tensions Arise",
-		"Tikal's Journey - 13: Fire in the Hole",
-		"Tikal's Journey - 14: Bog Killer",
-		"Tikal's Journey - 15: Undercover From Death",
-		"Tikal's Journey - 16: Boat Skirmish",
-		"Tikal's Journey - 17: Quake Wars",
-		"Tikal's Journey - 19: Eye of the Unbelieving",
-		"Tikal's Journey - 20: Size Matters",
-		"Tikal's Journey - 22: Volcanic Angels",
-		"Tikal's Journey - 23: Twilight Ascends",
-		"Tikal's Journey - 24: Against All Odds",
-		"Tikal's Journey - 25: Raising Hell",
-        ]
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
 
-    @functools.cached_property
-    def tikalgimmicks(self) -> List[str]:
-        return [		
-	        "Tikal's Journey - 18: Matak Alcatraz",
-		"Tikal's Journey - 21: Tribal Struggle",
-        ]    
-
-    @functools.cached_property
-    def kataraplanets(self) -> List[str]:
-        return [		
-		"Katara's Voyage - 1: The Voyage Begins",
-		"Katara's Voyage - 2: Separated",
-		"Katara's Voyage - 3: Preacher Panic",
-		"Katara's Voyage - 4: Surrounded By Rivals",
-		"Katara's Voyage - 5: Icy Madness",
-		"Katara's Voyage - 6: Facing Worlds",
-		"Katara's Voyage - 8: Air Temple of Death",
-		"Katara's Voyage - 9: Azula's Stronghold",
-                "Katara's Voyage - 10: End of the Line",
-        ]  
-
-    @functools.cached_property
-    def kataragimmicks(self) -> List[str]:
-        return [		
-	        "Katara's Voyage - 7: Dakini's Prison",
-        ]  
- 
-    @functools.cached_property
-    def ascensionplanets(self) -> List[str]:
-        return [		
-	    "Ascension - 1: Descendants",
-            "Ascension - 2: A New Journey",
-            "Ascension - 3: Distress Signal",
-            "Ascension - 5: Zealots",            
-            "Ascension - 7: The Gift Of Flames",
-            "Ascension - 8: Diverting Enemies",
-            "Ascension - 9: Tyranny",
-	    "Ascension - 10: Civil War",
-        ] 
-
-    @functools.cached_property
-    def ascensiongimmicks(self) -> List[str]:
-        return [		
-	        "Ascension - 4: Prisoners of War",
-	        "Ascension - 6: Trials of Blood",
-        ]   
-
-    @functools.cached_property
-    def witchplanets(self) -> List[str]:
-        return [		
-	    "The Witching Hour - 3: Great Indian Desert",
-	    "The Witching Hour - 4: Death on the Nile",
-	    "The Witching Hour - 6: Crimson Graveyard",
-	    "The Witching Hour - 8: The Instructor",
-	    "The Witching Hour - 9: Brainlust",
-            "The Witching Hour - 10: Glacial Prison",
-	    "The Witching Hour - 12: Book of the Dead",
-	    "The Witching Hour - 13: Avernus",
-            "The Witching Hour - 14: We're Not Alone",
-            "The Witching Hour - 15: Witches' Sabbath",	
-        ]
+    def draw(self, rng: Random) -> int:
+        index: int = int(rng.random() * len(self.probabilities))
+        return index if rng.random() < self.probabilities[index] else self.aliases[index]
 
-    @functools.cached_property
-    def witchgimmicks(self) -> List[str]:
-        return [		
-	    "The Witching Hour - 2: The Witching Hour",
-	    "The Witching Hour - 5: Beaks of the Beast",
-	    "The Witching Hour - 7: Memento Mori",
-	    "The Witching Hour - 11: Looking for Answers",
-	    "The Witching Hour - 16: Death's Denial",
-        ] 
- 
-    @functools.cached_property
-    def devilsystemplanets(self) -> List[str]:
-        return [
-		"The Devil System C1 - 1: The Exploration Begins",
-		"The Devil System C1 - 2: Power of Faith",
-		"The Devil System C1 - 3: Matak Attack",
-		"The Devil System C1 - 4: Lightning Eel",
-		"The Devil System C1 - 6: Two On Four",
-		"The Devil System C1 - 7: Land of the Wilds",
-		"The Devil System C1 - 8: The Legend of Kikikini",
-		"The Devil System C1 - 9: Help From Nowhere",
-		"The Devil System C1 - 11: Teamwork Forever",
-		"The Devil System C1 - 12: Sabotage",
-		"The Devil System C1 - 13: The Traitor",
-		"The Devil System C1 - 14: Allies Torn Apart",
-		"The Devil System C1 - 15: Taitaki's Introduction",
-		"The Devil System C1 - 16: Evil Land",
-		"The Devil System C1 - 18: Great Wall of Ice",
-	        "The Devil System C1 - 20: Harsh Climates",
-	        "The Devil System C1 - 21: Magical Protection",
-	        "The Devil System C1 - 22: Frozen Seas",
-	        "The Devil System C1 - 23: Hypnotic Menace",
-	        "The Devil System C1 - 24: Tribal Time Bomb",
-	        "The Devil System C1 - 26: Rubble Pile",
-	        "The Devil System C1 - 27: Contract Binaries",
-	        "The Devil System C1 - 28: Eternal Rain of Fire",
-        ]
 
-    @functools.cached_property
-    def devilgimmicks(self) -> List[str]:
-        return [	
-	    "The Devil System C1 - 17: Cold Welcome",
-	    "The Devil System C1 - 19: Wrath of the God",
-	    "The Devil System C1 - 25: Rupture",
-        ]
+MASK_64: int = (1 << 64) - 1
+GOLDEN_GAMMA: int = 0x9E3779B97F4A7C15
 
-    @functools.cached_property
-    def springplanets(self) -> List[str]:
-        return [		
-	    "Seasons: Spring - 1: Help on the Way",
-	    "Seasons: Spring - 2: Tribal Ascend",
-	    "Seasons: Spring - 4: Arrival",
-	    "Seasons: Spring - 5: The Conjuring",
-	    "Seasons: Spring - 6: Divided Attention",
-	    "Seasons: Spring - 8: The Bard's Tale",
-	    "Seasons: Spring - 9: Supercell Torture",
-	    "Seasons: Spring - 10: Hollow Canyon",
-	    "Seasons: Spring - 11: Eastern Winds",
-	    "Seasons: Spring - 12: Where Shamans Fall",		
-        ]
 
-    @functools.cached_property
-    def springgimmicks(self) -> List[str]:
-        return [	
-	    "Seasons: Spring - 3: One for the Team",
-	    "Seasons: Spring - 7: Through Fear",
+def mix64(value: int) -> int:
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK_64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK_64
 
-        ]
+    return value ^ (value >> 31)
 
-    @functools.cached_property
-    def summerplanets(self) -> List[str]:
-        return [		
-	    "Seasons: Summer - 1: Ring of Fire",
-	    "Seasons: Summer - 3: Clouded Warfare",
-	    "Seasons: Summer - 4: Sunny Morning",
-	    "Seasons: Summer - 5: Bouncin' Eight",
-	    "Seasons: Summer - 6: Build'N'Conquer",
-	    "Seasons: Summer - 7: Mirage",		
-        ]
 
-    @functools.cached_property
-    def summergimmicks(self) -> List[str]:
-        return [	
-	    "Seasons: Summer - 2: A Midsummer Twilight",
-	    "Seasons: Summer - 8: Southern Winds",
+def seed_value(seed: Any) -> int:
+    if isinstance(seed, int):
+        return seed
 
-        ]
+    import hashlib
 
-    @functools.cached_property
-    def autumnplanets(self) -> List[str]:
-        return [		
-	    "Seasons: Autumn - 1: Wind Howling",
-	    "Seasons: Autumn - 2: Far Steppe",
-	    "Seasons: Autumn - 4: The Bitter End",
-	    "Seasons: Autumn - 5: Chartreuse",
-	    "Seasons: Autumn - 6: Redleaf Battle",
-	    "Seasons: Autumn - 8: Western Winds",
-	    "Seasons: Autumn - 9: Torn Into Shreds",
-	    "Seasons: Autumn - 10: The Healer Skulks",
-	    "Seasons: Autumn - 11: Message For the Chumara",
-	    "Seasons: Autumn - 12: From the Shadows",		
-        ]
+    # Same for a given seed in every process, unlike hash()
+    return int.from_bytes(hashlib.sha256(repr(seed).encode("utf-8")).digest()[:8], "little")
 
-    @functools.cached_property
-    def autumngimmicks(self) -> List[str]:
-        return [	
-	    "Seasons: Autumn - 3: 44 Days",
-	    "Seasons: Autumn - 7: The Priest's Escort",
-        ]
 
-    @functools.cached_property
-    def winterplanets(self) -> List[str]:
-        return [		
-	    "Seasons: Winter - 1: It's Friday",
-	    "Seasons: Winter - 2: Time Has Come",
-	    "Seasons: Winter - 3: The Rift",
-	    "Seasons: Winter - 4: Meltdown",
-	    "Seasons: Winter - 5: High Issues",
-	    "Seasons: Winter - 6: Thaw on the Mountains",
-	    "Seasons: Winter - 8: Frozen Fruit",
-	    "Seasons: Winter - 10: Shattered Ice",
-	    "Seasons: Winter - 11: Pirate Isles",
-	    "Seasons: Winter - 12: Snonado",		
-        ]
+def stream_key(seed: int, slot: int = 0, index: int = 0) -> int:
+    key: int = mix64(seed & MASK_64)
+    key = mix64(key ^ mix64((slot + GOLDEN_GAMMA) & MASK_64))
 
-    @functools.cached_property
-    def wintergimmicks(self) -> List[str]:
-        return [	
-	    "Seasons: Winter - 7: Power of Two",
-	    "Seasons: Winter - 9: Northern Winds",
-        ]
+    return mix64(key ^ mix64((index + 2 * GOLDEN_GAMMA) & MASK_64))
 
-    @functools.cached_property
-    def warofthegodsplanets(self) -> List[str]:
-        return [		
-	    "War of the Gods - 1: Erecting Paths",
-	    "War of the Gods - 2: Hornet Nest",
-	    "War of the Gods - 3: Cursed Faith",
-	    "War of the Gods - 4: Triforce of Storms",
-	    "War of the Gods - 6: Supernatural Voodoo",
-	    "War of the Gods - 7: Inconspicious Odds",
-	    "War of the Gods - 8: Intercontinental Split",
-	    "War of the Gods - 9: Obscured From The Flow",
-	    "War of the Gods - 11: Perilous Spirits",
-	    "War of the Gods - 12: A Pushover Decision",
-	    "War of the Gods - 13: Ethereal Onslaught",
-	    "War of the Gods - 14: Ambush Assault",
-	    "War of the Gods - 16: Bloodthirsty",
-	    "War of the Gods - 17: Center Field",
-	    "War of the Gods - 18: Top Stalker",
-	    "War of the Gods - 19: Absurd Partners",
-	    "War of the Gods - 20: Demon's Flight",
-	    "War of the Gods - 21: Ruptured World",
-	    "War of the Gods - 23: Hellfire",
-	    "War of the Gods - 24: A Mortal's End",																	
-        ]
 
-    @functools.cached_property
-    def warofthegodsgimmicks(self) -> List[str]:
-        return [	
-	    "War of the Gods - 5: Black Death",
-	    "War of the Gods - 10: A Sinking Feeling",
-	    "War of the Gods - 15: Detained",
-	    "War of the Gods - 22: Stranded",
-	    "War of the Gods - 25: War of the Gods",
-        ]
+class ObjectiveRandom(Random):
+    # Counter-based SplitMix64: output n is a pure function of (key, n), so any stream can be
+    # created or skipped ahead in O(1) without replaying the draws before it
+    key: int
+    counter: int
 
+    def __init__(self, seed: Any = 0, slot: int = 0, index: int = 0) -> None:
+        super().__init__(seed)
 
-    @functools.cached_property
-    def adaptiveaiplanets(self) -> List[str]:
-        return [	
-	    "Adaptive AI - 1: SMP Roots",
-	    "Adaptive AI - 2: Mandala",
-	    "Adaptive AI - 3: Persimmon",
-	    "Adaptive AI - 4: Wasteland",
-	    "Adaptive AI - 5: Fortresses",
-	    "Adaptive AI - 6: Airstrike",
-	    "Adaptive AI - 7: Bloodlust",
-	    "Adaptive AI - 8: Blackout",
-	    "Adaptive AI - 9: Teleport Trickery",
-	    "Adaptive AI - 10: Calamity",
-	    "Adaptive AI - 11: Betrayal",
-	    "Adaptive AI - 12: Natural Disasters",
-	    "Adaptive AI - 13: Empowerment",
-	    "Adaptive AI - 14: Chosen Restrictions",
-	    "Adaptive AI - 15: Ring Islands",
-        ]
+        self.key = stream_key(seed_value(seed), slot, index)
 
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        self.key = stream_key(seed_value(a))
+        self.counter = 0
 
-    @staticmethod
-    def easychallenge() -> List[str]:
-        return [
-	    "Complete a Planet without worshipping anything",
-	    "Complete a Planet where you eliminate the Dakini Tribe last",
-	    "Complete a Planet where you eliminate the Chumara Tribe last",
-	    "Complete a Planet where you eliminate the Matak Tribe last",
-	    "Complete a Planet where all three Tribes are present",
-	    "Complete a Planet with only one enemy Tribe present",
-	    "Have 10 fully-built Guard Towers at once",
-	    "Have 5 Warrior Training Huts at once",
-	    "Have 5 Temples at once",
-	    "Have 5 Firewarrior or Archer Training Huts at once",
-	    "Convert an enemy Warrior with one of your Preachers",
-	    "Convert an enemy Firewarrior or Archer with one of your Preachers",
-	    "Kill an enemy Shaman by knocking them into water",
-	    "Use Call to Arms to defeat an enemy attack (Press B when a Warrior in a Guard Tower sees an enemy)",
-	    "Scare an enemy Shaman out of her Guard Tower using Swarm or Spies",
-            "Kill an enemy that is in the process of worshipping",
-            "Use the Lightning Bolt spell on an enemy Training Hut",
-	    "Conceal all of your buildings from worldview by using Spies in Guard Towers",
-	    "Destroy an enemy Warrior Training Hut",
-	    "Destroy an enemy Temple",
-	    "Destroy an enemy Firewarrior Training Hut",
-	    "Destroy an enemy Spy Training Hut",
-	    "Destroy an enemy Boat House",
-	    "Destroy an enemy Balloon Hut",
-            "On any planet, have one charge of every available spell",
-	    "Complete a planet without your Shaman dying",
-        ]
+    def getstate(self) -> Tuple[int, int]:
+        return self.key, self.counter
 
-    @staticmethod
-    def mediumchallenge() -> List[str]:
-        return [
-	    "Have 20 Large Huts at once",       
-            "Complete a Planet without training any Warriors",
-	    "Complete a Planet without training any Firewarriors or Archers",
-	    "Complete a Planet without training any Preachers",
-	    "Complete a Planet without making any vehicles",
-	    "Complete a Planet without putting any Firewarriors or Archers into Guard Towers",
-	    "Complete a Planet without using any patrol points or campfires",
-	    "Complete a Planet without using the Blast spell",
-	    "Complete a Planet without using the Convert spell",
-	    "Complete a Planet without using Landbridge, Flatten or Erode",
-	    "Successfully sabotage 5 buildings with Spies in a single Planet",
-	    "Have at least 200 followers at once",
-	    "Eliminate a tribe without ever damaging their buildings with your Shaman and her spells",
-	    "Eliminate a tribe with only your Shaman and her spells",
-	    "Complete a planet where you built your base far away from your reincarnation site",
-	    "Have 50 Warriors at once",
-	    "Have 50 Preachers at once",
-	    "Have 50 Firewarriors and/or Archers at once",
-            "Complete a Planet where you have an ally",
-            "Have 25 followers in Boats at once",
-            "Have 10 followers in Balloons at once",
-            "Have a Large Hut containing a Brave, Warrior, Preacher, Firewarrior and Spy",
-	    "Create a pile of at least 30 Wood",
-            "Obtain one of the three Guest Spells: Bloodlust, Teleport or Armageddon",
-]
+    def setstate(self, state: Tuple[int, int]) -> None:
+        self.key, self.counter = state
 
-    @staticmethod
-    def hardchallenge() -> List[str]:
-        return [
-	    "Complete a Planet without any of your buildings being completely destroyed",
-	    "Complete a Planet without using any building-destroying spells",
-	    "Complete a Planet without ever casting a spell on an enemy Shaman",
-	    "Have at least 100 followers at once without having any Braves",
-	    "Kill an enemy tribe's Angel of Death",
-            "Successfully defeat three tribes in Armageddon",
-	    "Completely destroy an enemy Training Hut/Temple by burning it with Spies",
-            "Complete a Planet where enemies are allied against you",
-            "Destroy an enemy structure using the Landbridge spell",
-            "Convert an enemy using a Hypnotized Preacher",
-            "Train a Hypnotized enemy in one of your Training Huts",
-            "Kill a non-brave Enemy in a vehicle with a Firewarrior in a vehicle",
-	    "Have one of every Training Hut and Vehicle Hut at the same time",
-	    "Have the maximum charges for Blast, Firestorm, Earthquake and Volcano at the same time",
-	    "Have the maximum charges for Landbridge, Flatten, Swamp and Erode at the same time",
-	    "Have the maximum charges for Convert, Invisibility, Magical Shield and Hypnotize at the same time",
-	    "Eliminate a tribe without completely destroying any of their buildings",
-            "Complete a Planet where an enemy tribe was eliminated by a tribe other than you",
-            "Complete a Planet where your Shaman commanded her followers from a Guard Tower that she never left",
+    def jump(self, steps: int) -> None:
+        self.counter += steps
+
+    def next64(self) -> int:
+        self.counter += 1
+        return mix64((self.key + self.counter * GOLDEN_GAMMA) & MASK_64)
+
+    def random(self) -> float:
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        bits: int = 0
+
+        for shift in range(0, k, 64):
+            bits |= self.next64() << shift
+
+        return bits & ((1 << k) - 1)
+
+
+class CompiledLabel(NamedTuple):
+    segments: Tuple[str, ...]
+    slots: Tuple[int, ...]
+
+
+def compile_label(label: str, keys: Sequence[str]) -> CompiledLabel:
+    # Same result as replacing the first occurrence of each key in turn, found once up front
+    found: List[Tuple[int, int, int]] = list()
+
+    for slot, key in enumerate(keys):
+        position: int = label.find(key)
+
+        if position != -1:
+            found.append((position, position + len(key), slot))
+
+    found.sort()
+
+    segments: List[str] = list()
+    start: int = 0
+
+    for position, end, _ in found:
+        segments.append(label[start:position])
+        start = end
+
+    segments.append(label[start:])
+
+    return CompiledLabel(segments=tuple(segments), slots=tuple(slot for _, _, slot in found))
+
+
+class ObjectiveSampler:
+    templates: Tuple[GameObjectiveTemplate, ...]
+    labels: Tuple[CompiledLabel, ...]
+    alias_table: AliasTable
+    pools: Tuple[Tuple[Tuple[str, Tuple[int, ...], Union[int, range]], ...], ...]
+    minimums: Tuple[Tuple[int, ...], ...]
+    locations: Dict[int, Tuple[Tuple[int, int], ...]]
+
+    def __init__(self, templates: Iterable[GameObjectiveTemplate]) -> None:
+        self.templates = tuple(templates)
+        self.labels = tuple(compile_label(template.label, tuple(template.data)) for template in self.templates)
+        self.alias_table = AliasTable([template.weight for template in self.templates])
+
+        self.pools = tuple(
+            tuple(
+                (key, STRINGS.intern_all(collection()), quantity) for key, (collection, quantity) in template.data.items()
+            )
+            for template in self.templates
+        )
+
+        self.minimums = tuple(
+            tuple(min(quantity) if isinstance(quantity, range) else quantity for _, _, quantity in slots)
+            for slots in self.pools
+        )
+
+        locations: Dict[int, List[Tuple[int, int]]] = dict()
+
+        for index, slots in enumerate(self.pools):
+            for slot, (_, pool, _) in enumerate(slots):
+                for string_id in pool:
+                    locations.setdefault(string_id, list()).append((index, slot))
+
+        self.locations = {string_id: tuple(places) for string_id, places in locations.items()}
+
+    def pick(self, index: int, rng: Random) -> Tuple[Tuple[int, ...], ...]:
+        picks: List[Tuple[int, ...]] = list()
+
+        for _, pool, quantity in self.pools[index]:
+            if isinstance(quantity, range):
+                quantity = rng.choice(quantity)
+
+            picks.append(tuple(rng.sample(pool, quantity)))
+
+        return tuple(picks)
+
+    def format(self, index: int, picks: Sequence[Sequence[int]]) -> str:
+        segments, slots = self.labels[index]
+
+        if not slots:
+            return segments[0]
+
+        strings: List[str] = STRINGS.strings
+        parts: List[str] = [segments[0]]
+
+        for gap, slot in enumerate(slots, 1):
+            slot_picks: Sequence[int] = picks[slot]
+
+            parts.append(strings[slot_picks[0]] if len(slot_picks) == 1 else ", ".join(map(STRINGS.text, slot_picks)))
+            parts.append(segments[gap])
+
+        return "".join(parts)
+
+    def format_many(self, draws: Iterable[Tuple[int, Sequence[Sequence[int]]]]) -> List[str]:
+        return [self.format(index, picks) for index, picks in draws]
+
+    def render(self, index: int, rng: Random) -> str:
+        return self.format(index, self.pick(index, rng))
+
+    def sample(self, seed: int, count: int) -> List[str]:
+        rng: Random = Random(seed)
+
+        draw: Callable[[Random], int] = self.alias_table.draw
+        return [self.render(draw(rng), rng) for _ in range(count)]
+
+    def iter_draws(self, rng: Random) -> Iterator[int]:
+        draw: Callable[[Random], int] = self.alias_table.draw
+
+        while True:
+            yield draw(rng)
+
+    def iter_objectives(self, seed: int, count: Optional[int] = None) -> Iterator[str]:
+        rng: Random = Random(seed)
+
+        for index in itertools.islice(self.iter_draws(rng), count):
+            yield self.render(index, rng)
+
+    def sample_objective(self, seed: int, slot: int, index: int) -> str:
+        rng: ObjectiveRandom = ObjectiveRandom(seed, slot, index)
+        return self.render(self.alias_table.draw(rng), rng)
+
+    def sample_slot(self, seed: int, slot: int, count: int) -> List[str]:
+        return [self.sample_objective(seed, slot, index) for index in range(count)]
+
+    def session(self, seed: int, unique: bool = True) -> ObjectiveDrawSession:
+        return ObjectiveDrawSession(self, Random(seed), unique)
+
+    def sample_compatible(self, seed: int, count: int) -> List[str]:
+        return self.session(seed).draw_many(count)
+
+
+class PoolDeck:
+    items: List[int]
+    positions: Dict[int, int]
+    cursor: int
+
+    def __init__(self, pool: Iterable[int]) -> None:
+        self.items = list(pool)
+        self.positions = {string_id: position for position, string_id in enumerate(self.items)}
+
+        # items[:cursor] were drawn in the current pass, items[cursor:] are still available
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def available(self) -> int:
+        return len(self.items) - self.cursor
+
+    def reset(self) -> None:
+        self.cursor = 0
+
+    def swap(self, first: int, second: int) -> None:
+        items: List[int] = self.items
+
+        items[first], items[second] = items[second], items[first]
+
+        self.positions[items[first]] = first
+        self.positions[items[second]] = second
+
+    def remove(self, string_id: int) -> None:
+        position: Optional[int] = self.positions.get(string_id)
+
+        if position is None:
+            return
+
+        if position < self.cursor:
+            self.cursor -= 1
+            self.swap(position, self.cursor)
+
+            position = self.cursor
+
+        self.swap(position, len(self.items) - 1)
+
+        self.items.pop()
+        del self.positions[string_id]
+
+    # Callers only ask for as many items as available() still holds
+    def draw(self, rng: Random, quantity: int, unique: bool) -> Tuple[int, ...]:
+        picks: List[int] = list()
+
+        # Partial Fisher-Yates: only the drawn positions are shuffled into place
+        for position in range(self.cursor, self.cursor + quantity):
+            self.swap(position, rng.randrange(position, len(self.items)))
+            picks.append(self.items[position])
+
+        if unique:
+            self.cursor += quantity
+
+        return tuple(picks)
+
+
+class ObjectiveDrawSession:
+    sampler: ObjectiveSampler
+    rng: Random
+    unique: bool
+    decks: List[List[PoolDeck]]
+    weights: List[int]
+    blocked: Set[int]
+    drawn: Set[int]
+
+    def __init__(self, sampler: ObjectiveSampler, rng: Random, unique: bool = True) -> None:
+        self.sampler = sampler
+        self.rng = rng
+        self.unique = unique
+
+        # Templates drawing from the same pool share one deck, so they never repeat each other's picks
+        shared: Dict[Tuple[int, ...], PoolDeck] = dict()
+
+        self.decks = [
+            [shared.setdefault(pool, PoolDeck(pool)) for _, pool, _ in slots]
+            for slots in sampler.pools
         ]
 
-    @staticmethod
-    def buildables() -> List[str]:
-        return [
-	    "Boats",
-	    "Balloons",
+        self.weights = [template.weight for template in sampler.templates]
+        self.blocked = set()
+
+        # Templates without pools that were drawn in the current pass
+        self.drawn = set()
+
+        self.update_weights()
+
+    def is_available(self, index: int) -> bool:
+        if self.unique and not self.decks[index] and index in self.drawn:
+            return False
+
+        return all(
+            deck.available() >= minimum for deck, minimum in zip(self.decks[index], self.sampler.minimums[index])
+        )
+
+    # A template stops being drawn once it was used up in this pass or its pools lost entries to conflicts
+    def update_weights(self) -> None:
+        self.weights = [
+            template.weight if self.is_available(index) else 0
+            for index, template in enumerate(self.sampler.templates)
         ]
 
+    # Only once every template is used up do the remaining entries become available again
+    def reshuffle(self) -> None:
+        for slots in self.decks:
+            for deck in slots:
+                deck.reset()
+
+        self.drawn.clear()
+        self.update_weights()
+
+    def remove(self, string_id: int) -> None:
+        for index, slot in self.sampler.locations.get(string_id, ()):
+            self.decks[index][slot].remove(string_id)
+
+    def block_conflicts(self, string_id: int) -> None:
+        for conflict_id in conflict_index().get(string_id, ()):
+            if conflict_id not in self.blocked:
+                self.blocked.add(conflict_id)
+                self.remove(conflict_id)
+
+    def pick(self, index: int) -> Tuple[Tuple[int, ...], ...]:
+        picks: List[Tuple[int, ...]] = list()
+
+        for deck, (_, _, quantity) in zip(self.decks[index], self.sampler.pools[index]):
+            if isinstance(quantity, range):
+                quantity = min(self.rng.choice(quantity), deck.available())
+
+            picks.append(deck.draw(self.rng, quantity, self.unique))
+
+        return tuple(picks)
+
+    def draw(self) -> Optional[str]:
+        if self.unique and not any(self.weights):
+            self.reshuffle()
+
+        if not any(self.weights):
+            return None
+
+        index: int = self.rng.choices(range(len(self.weights)), weights=self.weights)[0]
+        picks: Tuple[Tuple[int, ...], ...] = self.pick(index)
+
+        self.drawn.add(index)
+
+        for slot_picks in picks:
+            for string_id in slot_picks:
+                self.block_conflicts(string_id)
+
+        self.update_weights()
+
+        return self.sampler.format(index, picks)
+
+    def draw_many(self, count: int) -> List[str]:
+        objectives: List[str] = list()
+
+        for _ in range(count):
+            objective: Optional[str] = self.draw()
+
+            if objective is None:
+                break
+
+            objectives.append(objective)
+
+        return objectives
+
+
+# Filtering by difficulty and duration happens here, once per profile, instead of on every draw
+@functools.lru_cache(maxsize=None)
+def objective_sampler(mask: int, include_difficult: bool, include_time_consuming: bool) -> ObjectiveSampler:
+    return ObjectiveSampler(
+        template for template in objective_templates(mask)
+        if (include_difficult or not template.is_difficult)
+        and (include_time_consuming or not template.is_time_consuming)
+    )
+
+
+def precompute_objective_samplers(masks: Optional[Iterable[int]] = None) -> None:
+    for mask in range(OPTION_MASK_COUNT) if masks is None else masks:
+        for include_difficult, include_time_consuming in itertools.product((False, True), repeat=2):
+            objective_sampler(mask, include_difficult, include_time_consuming)
+
+
+class ObjectiveShare(NamedTuple):
+    objective: str
+    template: str
+    key: Optional[str]
+    weight: int
+    is_difficult: bool
+    is_time_consuming: bool
+    multiplicity: int
+
+    # The objective can be drawn under any option mask that has every bit of one of these
+    requires_any: Tuple[int, ...]
+
+
+class ObjectiveShareTable(NamedTuple):
+    shares: Tuple[ObjectiveShare, ...]
+
+    # Per pool key, how many pool entries each set of requirements makes available
+    pool_groups: Tuple[Tuple[str, Tuple[Tuple[Tuple[int, ...], int], ...]], ...]
+
+    # Pool key, weight, is_difficult and is_time_consuming of every template
+    templates: Tuple[Tuple[Optional[str], int, bool, bool], ...]
+
+
+class MaskFactors(NamedTuple):
+    pool_sizes: Dict[str, int]
+    total_weights: Dict[Tuple[bool, bool], int]
+
+
+def minimal_requirements(requirements: Iterable[int]) -> Tuple[int, ...]:
+    minimal: List[int] = list()
+
+    # A requirement containing a smaller one never decides anything
+    for requirement in sorted(set(requirements), key=lambda bits: bin(bits).count("1")):
+        if not any(requirement & other == other for other in minimal):
+            minimal.append(requirement)
+
+    return tuple(sorted(minimal))
+
+
+def is_available(mask: int, requires_any: Tuple[int, ...]) -> bool:
+    return any(mask & requirement == requirement for requirement in requires_any)
+
+
+# Every objective any option mask can draw, with the option bits that make it available
+@functools.lru_cache(maxsize=None)
+def objective_share_table() -> ObjectiveShareTable:
+    catalog: MissionCatalog = mission_catalog()
+    options_by_campaign: Dict[str, str] = {campaign: key for key, campaign in CAMPAIGNS_BY_OPTION.items()}
+
+    # The base campaign is always enabled, so its missions only depend on the gimmick bit
+    bits_by_label: Dict[int, int] = dict()
+
+    for mission in catalog.missions:
+        bits: int = CAMPAIGN_BITS.get(options_by_campaign.get(mission.campaign, ""), 0)
+
+        if mission.is_gimmick:
+            bits |= GIMMICK_BIT
+
+        bits_by_label[STRINGS.intern(mission.label)] = bits
+
+    shares: List[ObjectiveShare] = list()
+    templates: List[Tuple[Optional[str], int, bool, bool]] = list()
+    pools: Dict[str, Tuple[str, ...]] = dict()
+    groups: Dict[str, Dict[Tuple[int, ...], int]] = dict()
+
+    # Pools only grow with the option mask, so the full mask has every template and entry another mask can have
+    for template in objective_templates(OPTION_MASK_COUNT - 1):
+        if not template.data:
+            templates.append((None, template.weight, template.is_difficult, template.is_time_consuming))
+
+            shares.append(ObjectiveShare(
+                objective=template.label,
+                template=template.label,
+                key=None,
+                weight=template.weight,
+                is_difficult=template.is_difficult,
+                is_time_consuming=template.is_time_consuming,
+                multiplicity=1,
+                requires_any=(0,),
+            ))
+
+            continue
+
+        key, (collection, quantity) = list(template.data.items())[0]
+
+        if len(template.data) > 1 or quantity != 1:
+            raise ValueError(f"Template '{template.label}' draws more than one item, which is not analysed")
+
+        pool: Tuple[str, ...] = tuple(collection())
+
+        if pools.setdefault(key, pool) != pool:
+            raise ValueError(f"Templates using '{key}' draw from different pools, which is not analysed")
+
+        templates.append((key, template.weight, template.is_difficult, template.is_time_consuming))
+
+        # Templates using the same key share its pool, so it is only counted once
+        counts: Optional[Dict[Tuple[int, ...], int]] = None if key in groups else groups.setdefault(key, dict())
+
+        # Entries listed more than once in a pool are proportionally more likely
+        for item, multiplicity in Counter(pool).items():
+            if key == "PLANETS":
+                requires_any: Tuple[int, ...] = (bits_by_label[STRINGS.intern(item)],)
+            elif key in SUPPORTED_POOL_KEYS:
+                requires_any = minimal_requirements(
+                    bits_by_label[label_id] for label_id in catalog.supporting[SUPPORTED_POOL_KEYS[key]][item]
+                )
+            else:
+                requires_any = (0,)
+
+            if counts is not None:
+                counts[requires_any] = counts.get(requires_any, 0) + multiplicity
+
+            shares.append(ObjectiveShare(
+                objective=template.label.replace(key, item, 1),
+                template=template.label,
+                key=key,
+                weight=template.weight,
+                is_difficult=template.is_difficult,
+                is_time_consuming=template.is_time_consuming,
+                multiplicity=multiplicity,
+                requires_any=requires_any,
+            ))
+
+    return ObjectiveShareTable(
+        shares=tuple(shares),
+        pool_groups=tuple((key, tuple(counts.items())) for key, counts in groups.items()),
+        templates=tuple(templates),
+    )
+
+
+# Pool sizes and per-profile total template weight under one option mask, without building its pools
+def mask_factors(mask: int) -> MaskFactors:
+    table: ObjectiveShareTable = objective_share_table()
+
+    pool_sizes: Dict[str, int] = {
+        key: sum(count for requires_any, count in counts if is_available(mask, requires_any))
+        for key, counts in table.pool_groups
+    }
+
+    total_weights: Dict[Tuple[bool, bool], int] = dict()
+
+    for include_difficult, include_time_consuming in itertools.product((False, True), repeat=2):
+        # A template whose pool is empty under this mask is left out, as in build_objective_templates()
+        total_weights[(include_difficult, include_time_consuming)] = sum(
+            weight for key, weight, is_difficult, is_time_consuming in table.templates
+            if (key is None or pool_sizes[key] > 0)
+            and (include_difficult or not is_difficult)
+            and (include_time_consuming or not is_time_consuming)
+        )
+
+    return MaskFactors(pool_sizes=pool_sizes, total_weights=total_weights)
+
+
+# Exact probability of each rendered objective for one independent draw under the given profile:
+# weight * multiplicity / (pool size * total weight) for every objective the mask makes available
+def objective_distribution(mask: int, include_difficult: bool, include_time_consuming: bool) -> Dict[str, Fraction]:
+    from fractions import Fraction
+
+    factors: MaskFactors = mask_factors(mask)
+    total_weight: int = factors.total_weights[(include_difficult, include_time_consuming)]
+
+    distribution: Dict[str, Fraction] = dict()
+
+    for share in objective_share_table().shares:
+        if share.is_difficult and not include_difficult or share.is_time_consuming and not include_time_consuming:
+            continue
+
+        if not is_available(mask, share.requires_any):
+            continue
+
+        pool_size: int = 1 if share.key is None else factors.pool_sizes[share.key]
+        probability: Fraction = Fraction(share.weight * share.multiplicity, pool_size * total_weight)
+
+        distribution[share.objective] = distribution.get(share.objective, Fraction(0)) + probability
+
+    return distribution
+
+
+# Exact probability of every objective each of the given option masks can draw, under every difficulty
+# and duration profile, as a Fraction written p/q and as a float
+def write_objective_distribution_csv(output_file: TextIO, masks: Iterable[int]) -> None:
+    import csv
+
+    writer = csv.writer(output_file)
+    writer.writerow(("mask", "include_difficult", "include_time_consuming", "objective", "probability", "exact"))
+
+    for mask in masks:
+        for include_difficult, include_time_consuming in itertools.product((False, True), repeat=2):
+            distribution: Dict[str, Fraction] = objective_distribution(mask, include_difficult, include_time_consuming)
+
+            for objective, probability in sorted(distribution.items()):
+                writer.writerow((
+                    mask,
+                    int(include_difficult),
+                    int(include_time_consuming),
+                    objective,
+                    float(probability),
+                    f"{probability.numerator}/{probability.denominator}",
+                ))
+
+
+# Every option mask in factored form, as one row per objective probability would be millions of rows:
+# shares_file has one row per distinct objective and factors_file one row per option mask. An objective's
+# probability is weight * multiplicity / (pool size * total weight) under any mask that has every bit of
+# one of its requires_any values, and 0 under the rest
+def write_objective_factors_csv(
+    shares_file: TextIO,
+    factors_file: TextIO,
+    masks: Optional[Iterable[int]] = None,
+) -> None:
+    import csv
+
+    table: ObjectiveShareTable = objective_share_table()
+
+    writer = csv.writer(shares_file)
+    writer.writerow((
+        "objective", "template", "pool", "weight", "is_difficult", "is_time_consuming", "multiplicity", "requires_any",
+    ))
+
+    for share in table.shares:
+        writer.writerow((
+            share.objective,
+            share.template,
+            share.key or "",
+            share.weight,
+            int(share.is_difficult),
+            int(share.is_time_consuming),
+            share.multiplicity,
+            " ".join(map(str, share.requires_any)),
+        ))
+
+    keys: List[str] = [key for key, _ in table.pool_groups]
+    profiles: List[Tuple[bool, bool]] = list(itertools.product((False, True), repeat=2))
+
+    writer = csv.writer(factors_file)
+    writer.writerow((
+        "mask",
+        *(f"{key} pool size" for key in keys),
+        *(f"total weight d{int(include_difficult)} t{int(include_time_consuming)}"
+          for include_difficult, include_time_consuming in profiles),
+    ))
+
+    for mask in range(OPTION_MASK_COUNT) if masks is None else masks:
+        factors: MaskFactors = mask_factors(mask)
+
+        writer.writerow((
+            mask,
+            *(factors.pool_sizes[key] for key in keys),
+            *(factors.total_weights[profile] for profile in profiles),
+        ))
+
+
+class CallStats(NamedTuple):
+    calls: int
+    total_seconds: float
+    p99_seconds: float
+    mean_pool_size: Optional[float]
+    max_pool_size: Optional[int]
+
+
+class Instrumentation:
+    durations: Dict[str, List[float]]
+    pool_sizes: Dict[str, List[int]]
+
+    def __init__(self) -> None:
+        self.durations = dict()
+        self.pool_sizes = dict()
+
+    def record(self, name: str, seconds: float, result: Any) -> None:
+        self.durations.setdefault(name, list()).append(seconds)
+
+        if isinstance(result, (list, tuple)):
+            self.pool_sizes.setdefault(name, list()).append(len(result))
+
+    def wrap(self, name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+            result: Any = function(*args, **kwargs)
+
+            self.record(name, time.perf_counter() - start, result)
+
+            return result
+
+        return wrapper
+
+    def snapshot(self) -> Dict[str, CallStats]:
+        stats: Dict[str, CallStats] = dict()
+
+        for name, durations in self.durations.items():
+            ordered: List[float] = sorted(durations)
+            sizes: List[int] = self.pool_sizes.get(name, list())
+
+            stats[name] = CallStats(
+                calls=len(ordered),
+                total_seconds=sum(ordered),
+                p99_seconds=ordered[max(0, -(-len(ordered) * 99 // 100) - 1)],
+                mean_pool_size=sum(sizes) / len(sizes) if sizes else None,
+                max_pool_size=max(sizes) if sizes else None,
+            )
+
+        return stats
+
+
+# Set while instrument() is active
+_instrumentation: Optional[Instrumentation] = None
+
+
+@contextlib.contextmanager
+def instrument() -> Iterator[Instrumentation]:
+    global _instrumentation
+
+    if _instrumentation is not None:
+        raise RuntimeError("PopulousTheBeginningGame is already being instrumented")
+
+    instrumentation: Instrumentation = Instrumentation()
+    originals: Dict[str, Any] = dict()
+
+    # Wrappers are only installed here, so nothing is paid for instrumentation outside of this block
+    for name, attribute in list(vars(PopulousTheBeginningGame).items()):
+        if isinstance(attribute, property) and name.startswith("has"):
+            wrapped: Any = property(instrumentation.wrap(name, attribute.fget))
+        elif isinstance(attribute, staticmethod):
+            wrapped = staticmethod(instrumentation.wrap(name, attribute.__func__))
+        elif name in ("planets", "game_objective_templates"):
+            wrapped = instrumentation.wrap(name, attribute)
+        else:
+            continue
+
+        originals[name] = attribute
+        setattr(PopulousTheBeginningGame, name, wrapped)
+
+    # The sampler resolves its pools once, so objectives are timed where they are rendered
+    sampler_originals: Dict[str, Any] = {name: vars(ObjectiveSampler)[name] for name in ("render", "format")}
+
+    for name, attribute in sampler_originals.items():
+        setattr(ObjectiveSampler, name, instrumentation.wrap(f"ObjectiveSampler.{name}", attribute))
+
+    # Pools are looked up through these module functions by planets(), the templates and the sampler
+    pool_functions: Dict[str, Any] = {
+        name: globals()[name] for name in ("planet_pool_ids", "planet_pool", "supported_pool")
+    }
+
+    for name, function in pool_functions.items():
+        wrapped = instrumentation.wrap(name, function)
+        wrapped.cache_info = function.cache_info
+        wrapped.cache_clear = function.cache_clear
+
+        globals()[name] = wrapped
+
+    # Cached templates and samplers hold on to the pool callables, so rebuild them around the wrappers
+    objective_templates.cache_clear()
+    objective_sampler.cache_clear()
+
+    _instrumentation = instrumentation
+
+    try:
+        yield instrumentation
+    finally:
+        for name, attribute in originals.items():
+            setattr(PopulousTheBeginningGame, name, attribute)
+
+        for name, attribute in sampler_originals.items():
+            setattr(ObjectiveSampler, name, attribute)
+
+        globals().update(pool_functions)
+
+        objective_templates.cache_clear()
+        objective_sampler.cache_clear()
+
+        _instrumentation = None
+
+
+def instrumentation_snapshot() -> Dict[str, CallStats]:
+    return _instrumentation.snapshot() if _instrumentation is not None else dict()
+
+
+OBJECTIVE_CODEC_MAGIC: bytes = b"PTBO"
+
+# Magic, catalog version, objective count
+_objective_codec_header: struct.Struct = struct.Struct("<4s8sI")
+
+# Pool and item parts of the code for a template without placeholders
+NO_POOL: int = 0xFF
+NO_ITEM: int = 0xFFFF
+
+
+class ObjectiveCodec:
+    version: bytes
+    codes: Dict[str, int]
+    objectives: Dict[int, str]
+
+    def __init__(self, templates: Sequence[GameObjectiveTemplate]) -> None:
+        self.codes = dict()
+
+        for template_id, template in enumerate(templates):
+            if not template.data:
+                self.codes[template.label] = self.pack(template_id, NO_POOL, NO_ITEM)
+                continue
+
+            # Every template here fills a single placeholder with a single item
+            for pool_id, (key, (collection, _)) in enumerate(template.data.items()):
+                for item_id, item in enumerate(collection()):
+                    self.codes.setdefault(template.label.replace(key, item, 1), self.pack(template_id, pool_id, item_id))
+
+        self.objectives = {code: objective for objective, code in self.codes.items()}
+
+        import hashlib
+
+        content: str = "\n".join(f"{code}|{objective}" for objective, code in sorted(self.codes.items()))
+        self.version = hashlib.sha256(content.encode("utf-8")).digest()[:8]
+
     @staticmethod
-    def tribe() -> List[str]:
-        return [
-            "Matak",
-	    "Chumara",
-            "Dakini",
-        ]
-        
+    def pack(template_id: int, pool_id: int, item_id: int) -> int:
+        return template_id << 24 | pool_id << 16 | item_id
+
     @staticmethod
-    def spells() -> List[str]:
-        return [
-            "Angel of Death",
-            "Blast",
-            "Convert",
-            "Earthquake",
-            "Erode",
-            "Firestorm",
-            "Flatten",
-            "Hypnotise",
-            "Invisibility",
-            "Landbridge",
-            "Lightning",
-            "Magical Shield",
-            "Swamp",
-            "Swarm",
-            "Tornado",
-            "Volcano",
-        ]
+    def unpack(code: int) -> Tuple[int, int, int]:
+        return code >> 24, code >> 16 & 0xFF, code & 0xFFFF
+
+    def code(self, objective: str) -> Tuple[int, int, int]:
+        return self.unpack(self.codes[objective])
+
+    def encode(self, objectives: Iterable[str]) -> bytes:
+        codes: List[int] = list(map(self.codes.__getitem__, objectives))
+
+        # Codes are little-endian 32-bit words whatever the platform, like the header
+        return (
+            _objective_codec_header.pack(OBJECTIVE_CODEC_MAGIC, self.version, len(codes))
+            + struct.pack(f"<{len(codes)}I", *codes)
+        )
+
+    def decode(self, data: bytes) -> List[str]:
+        magic, version, count = _objective_codec_header.unpack_from(data, 0)
+
+        if magic != OBJECTIVE_CODEC_MAGIC:
+            raise ValueError("Not an encoded Populous objective set")
+
+        if version != self.version:
+            raise ValueError("Encoded Populous objectives were written against a different catalog version")
+
+        codes: Tuple[int, ...] = struct.unpack_from(f"<{count}I", data, _objective_codec_header.size)
+
+        return list(map(self.objectives.__getitem__, codes))
+
+
+# Built from every campaign with gimmicks on, so it can encode objectives drawn under any option mask
+@functools.lru_cache(maxsize=None)
+def objective_codec() -> ObjectiveCodec:
+    return ObjectiveCodec(objective_templates(OPTION_MASK_COUNT - 1))
+
+
+COMPLETION_MAGIC: bytes = b"PTBC"
+
+# Magic, catalog version, number of objectives and number of slots in the compacted section
+_completion_header: struct.Struct = struct.Struct("<4s8sII")
+
+# Size in bytes of each objective's UTF-8 text in the table that follows the header
+_completion_text: struct.Struct = struct.Struct("<H")
+
+# Slot and size in bytes of its completion bitset
+_completion_slot: struct.Struct = struct.Struct("<IH")
+
+# Slot, objective id and whether it is completed, appended after the compacted section
+_completion_update: struct.Struct = struct.Struct("<IIB")
+
+
+class ObjectiveCompletionTracker:
+    path: str
+    compact_every: int
+    version: bytes
+    objectives: Tuple[str, ...]
+    ids: Dict[str, int]
+    table: bytes
+    slots: Dict[int, int]
+    pending: int
+
+    def __init__(self, path: str, compact_every: int = 4096) -> None:
+        codec: ObjectiveCodec = objective_codec()
+
+        self.path = path
+        self.compact_every = compact_every
+        self.version = codec.version
+
+        # Ordered by objective code so ids stay stable for as long as the catalog version does
+        self.objectives = tuple(codec.objectives[code] for code in sorted(codec.objectives))
+        self.ids = {objective: objective_id for objective_id, objective in enumerate(self.objectives)}
+
+        # Written with every compaction, so a log can be read back after the catalog changes
+        self.table = b"".join(
+            _completion_text.pack(len(text)) + text
+            for text in (objective.encode("utf-8") for objective in self.objectives)
+        )
+
+        self.slots = dict()
+        self.pending = 0
+
+        if os.path.exists(path):
+            self.load()
+        else:
+            self.compact()
+
+        self.log = open(path, "ab")
+
+    def load(self) -> None:
+        # The whole state is restored from a single sequential read
+        with open(self.path, "rb") as completion_file:
+            data: bytes = completion_file.read()
+
+        # A file that was created but never written holds no completions yet
+        if not data:
+            self.compact()
+            return
+
+        if len(data) < _completion_header.size:
+            raise ValueError(f"{self.path} is not a Populous completion log")
+
+        magic, version, objective_count, slot_count = _completion_header.unpack_from(data, 0)
+
+        if magic != COMPLETION_MAGIC:
+            raise ValueError(f"{self.path} is not a Populous completion log")
+
+        offset: int = _completion_header.size
+
+        # Ids in the file are positions in the objective table it was written with
+        file_objectives: List[str] = list()
+
+        for _ in range(objective_count):
+            (size,) = _completion_text.unpack_from(data, offset)
+            offset += _completion_text.size
+
+            file_objectives.append(data[offset:offset + size].decode("utf-8"))
+            offset += size
+
+        # After a catalog change, ids are matched up by objective text. Objectives the catalog no longer has
+        # can neither be drawn nor checked, so their completions are dropped
+        remap: Optional[List[Optional[int]]] = None
+
+        if version != self.version:
+            remap = [self.ids.get(objective) for objective in file_objectives]
+
+        for _ in range(slot_count):
+            slot, size = _completion_slot.unpack_from(data, offset)
+            offset += _completion_slot.size
+
+            bits: int = int.from_bytes(data[offset:offset + size], "little")
+            offset += size
+
+            self.slots[slot] = bits if remap is None else self.remap_bits(bits, remap)
+
+        # A partially written trailing record from an interrupted append is ignored
+        end: int = offset + (len(data) - offset) // _completion_update.size * _completion_update.size
+
+        if end < len(data):
+            with open(self.path, "r+b") as completion_file:
+                completion_file.truncate(end)
+
+        for slot, objective_id, completed in _completion_update.iter_unpack(data[offset:end]):
+            if remap is not None:
+                new_id: Optional[int] = remap[objective_id] if objective_id < len(remap) else None
+
+                if new_id is None:
+                    continue
+
+                objective_id = new_id
+
+            self.apply(slot, objective_id, bool(completed))
+            self.pending += 1
+
+        # Appends use this catalog's ids from now on, so the file is rewritten with its table first
+        if remap is not None:
+            self.compact()
 
     @staticmethod
-    def idols() -> List[str]:
-        return [
-		"Stone Head",
-                "Totem Pole",
-		"Vault of Knowledge",
-		"Obelisk, Gargoyle or Portal",
+    def remap_bits(bits: int, remap: Sequence[Optional[int]]) -> int:
+        remapped: int = 0
+
+        for old_id, new_id in enumerate(remap):
+            if new_id is not None and bits >> old_id & 1:
+                remapped |= 1 << new_id
+
+        return remapped
+
+    def apply(self, slot: int, objective_id: int, completed: bool) -> None:
+        bits: int = self.slots.get(slot, 0)
+        self.slots[slot] = bits | (1 << objective_id) if completed else bits & ~(1 << objective_id)
+
+    def is_completed(self, slot: int, objective: str) -> bool:
+        return bool(self.slots.get(slot, 0) >> self.ids[objective] & 1)
+
+    def set_completed(self, slot: int, objective: str, completed: bool = True) -> None:
+        objective_id: int = self.ids[objective]
+
+        self.apply(slot, objective_id, completed)
+
+        self.log.write(_completion_update.pack(slot, objective_id, int(completed)))
+        self.log.flush()
+
+        self.pending += 1
+
+        if self.pending >= self.compact_every:
+            self.compact()
+
+    def completed(self, slot: int) -> List[str]:
+        bits: int = self.slots.get(slot, 0)
+        return [objective for objective_id, objective in enumerate(self.objectives) if bits >> objective_id & 1]
+
+    def compact(self) -> None:
+        chunks: List[bytes] = [
+            _completion_header.pack(COMPLETION_MAGIC, self.version, len(self.objectives), len(self.slots)),
+            self.table,
         ]
 
+        for slot, bits in sorted(self.slots.items()):
+            size: int = (bits.bit_length() + 7) // 8
+
+            chunks.append(_completion_slot.pack(slot, size))
+            chunks.append(bits.to_bytes(size, "little"))
+
+        log: Optional[Any] = getattr(self, "log", None)
+
+        if log is not None:
+            log.close()
+
+        temporary_path: str = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "wb") as completion_file:
+            completion_file.write(b"".join(chunks))
+
+        os.replace(temporary_path, self.path)
+
+        self.pending = 0
+
+        if log is not None:
+            self.log = open(self.path, "ab")
+
+    def close(self) -> None:
+        self.log.close()
+
+    def __enter__(self) -> ObjectiveCompletionTracker:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+SNAPSHOT_MAGIC: bytes = b"PTBS"
+SNAPSHOT_VERSION: int = 2
+
+# Magic, version, content hash, string table size, label count, mask count
+_snapshot_header: struct.Struct = struct.Struct("<4sH32sIII")
+
+# Offset of a mask's first label index and of the one after its last, followed by its supported entries
+_snapshot_entry: struct.Struct = struct.Struct("<III")
+
+
+# Every entry a supported pool can hold, one bit each in a snapshot's supported entries
+def supported_entries() -> Tuple[Tuple[str, str], ...]:
+    return tuple(
+        (name, value) for name in MISSION_REQUIREMENTS for value in getattr(PopulousTheBeginningGame, name)()
+    )
+
+
+# Hashes the raw catalog and bit layout, so a snapshot can be checked without building the catalog
+def snapshot_hash() -> bytes:
+    import hashlib
+
+    content: Tuple[Any, ...] = (
+        SNAPSHOT_VERSION,
+        load_missions(),
+        BASE_CAMPAIGN,
+        tuple(CAMPAIGNS_BY_OPTION.items()),
+        tuple(CAMPAIGN_BITS.items()),
+        GIMMICK_BIT,
+        supported_entries(),
+        tuple(CAMPAIGN_DURATIONS.items()),
+        tuple(MISSION_ESTIMATE_OVERRIDES.items()),
+    )
+
+    return hashlib.sha256(repr(content).encode("utf-8")).digest()
+
+
+def select(items: Sequence[Any], indices: Sequence[int]) -> Tuple[Any, ...]:
+    if len(indices) < 2:
+        return tuple(items[index] for index in indices)
+
+    # itemgetter gathers the whole selection in C
+    return operator.itemgetter(*indices)(items)
+
+
+class PoolSnapshot:
+    labels: Tuple[str, ...]
+    string_ids: Tuple[int, ...]
+    supported_entries: Tuple[Tuple[str, str], ...]
+    estimates: Dict[int, MissionEstimate]
+    masks: Tuple[int, ...]
+    entries_offset: int
+    indices_offset: int
+    buffer: Union[bytes, mmap.mmap]
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        magic, version, content_hash, strings_size, label_count, mask_count = _snapshot_header.unpack_from(buffer, 0)
+
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION or content_hash != snapshot_hash():
+            raise ValueError("Populous pool snapshot is stale or not a snapshot")
+
+        offset: int = _snapshot_header.size
+
+        self.labels = tuple(bytes(buffer[offset:offset + strings_size]).decode("utf-8").split("\n"))
+        offset += strings_size
+
+        # Pools decode to the same ids as pools built from the catalog
+        self.string_ids = STRINGS.intern_all(self.labels)
+        self.supported_entries = supported_entries()
+
+        minutes: Tuple[int, ...] = struct.unpack_from(f"<{label_count}H", buffer, offset)
+        offset += 2 * label_count
+
+        difficulties: Tuple[int, ...] = struct.unpack_from(f"<{label_count}B", buffer, offset)
+        offset += label_count
+
+        self.estimates = {
+            string_id: MissionEstimate(minutes=minutes[index], difficulty=difficulties[index])
+            for index, string_id in enumerate(self.string_ids)
+        }
+
+        # Sorted, so a mask's entry is found by binary search instead of building a dict of every mask
+        self.masks = struct.unpack_from(f"<{mask_count}I", buffer, offset)
+        offset += 4 * mask_count
+
+        self.entries_offset = offset
+        self.indices_offset = offset + _snapshot_entry.size * mask_count
+
+        self.buffer = buffer
+
+    def entry(self, mask: int) -> Optional[Tuple[int, int, int]]:
+        position: int = bisect.bisect_left(self.masks, mask)
+
+        if position == len(self.masks) or self.masks[position] != mask:
+            return None
+
+        return _snapshot_entry.unpack_from(self.buffer, self.entries_offset + _snapshot_entry.size * position)
+
+    def indices(self, mask: int) -> Optional[Tuple[int, ...]]:
+        entry: Optional[Tuple[int, int, int]] = self.entry(mask)
+
+        if entry is None:
+            return None
+
+        start, end, _ = entry
+        return struct.unpack_from(f"<{end - start}H", self.buffer, self.indices_offset + 2 * start)
+
+    def pool_ids(self, mask: int) -> Optional[Tuple[int, ...]]:
+        indices: Optional[Tuple[int, ...]] = self.indices(mask)
+        return None if indices is None else select(self.string_ids, indices)
+
+    def pool(self, mask: int) -> Optional[Tuple[str, ...]]:
+        indices: Optional[Tuple[int, ...]] = self.indices(mask)
+        return None if indices is None else select(self.labels, indices)
+
+    def supported_pool(self, mask: int, name: str) -> Optional[Tuple[str, ...]]:
+        entry: Optional[Tuple[int, int, int]] = self.entry(mask)
+
+        if entry is None:
+            return None
+
+        supported: int = entry[2]
+
+        return tuple(
+            value for bit, (pool_name, value) in enumerate(self.supported_entries)
+            if pool_name == name and supported >> bit & 1
+        )
+
+
+def export_snapshot(masks: Optional[Iterable[int]] = None) -> bytes:
+    snapshot_masks: List[int] = sorted(set(range(OPTION_MASK_COUNT) if masks is None else masks))
+
+    catalog: MissionCatalog = mission_catalog()
+
+    # Sorted so that decoding a mask's indices in order yields an already sorted pool
+    labels: List[str] = sorted(mission.label for mission in catalog.missions)
+    indices: Dict[int, int] = {STRINGS.intern(label): index for index, label in enumerate(labels)}
+
+    estimates: List[MissionEstimate] = [catalog.estimates[STRINGS.intern(label)] for label in labels]
+
+    strings: bytes = "\n".join(labels).encode("utf-8")
+
+    entries: List[bytes] = list()
+    mask_indices: List[int] = list()
+
+    for mask in snapshot_masks:
+        start: int = len(mask_indices)
+        mask_indices.extend(indices[string_id] for string_id in build_planet_pool_ids(mask))
+
+        supported_pools: Dict[str, Tuple[str, ...]] = {
+            name: build_supported_pool(mask, name) for name in MISSION_REQUIREMENTS
+        }
+
+        supported: int = 0
+
+        for bit, (name, value) in enumerate(supported_entries()):
+            if value in supported_pools[name]:
+                supported |= 1 << bit
+
+        entries.append(_snapshot_entry.pack(start, len(mask_indices), supported))
+
+    return b"".join((
+        _snapshot_header.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, snapshot_hash(), len(strings), len(labels), len(snapshot_masks)),
+        strings,
+        struct.pack(f"<{len(labels)}H", *(estimate.minutes for estimate in estimates)),
+        struct.pack(f"<{len(labels)}B", *(estimate.difficulty for estimate in estimates)),
+        struct.pack(f"<{len(snapshot_masks)}I", *snapshot_masks),
+        b"".join(entries),
+        struct.pack(f"<{len(mask_indices)}H", *mask_indices),
+    ))
+
+
+def load_snapshot(path: str) -> Optional[PoolSnapshot]:
+    import mmap
+
+    try:
+        with open(path, "rb") as snapshot_file:
+            buffer: mmap.mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        return PoolSnapshot(buffer)
+    except (ValueError, struct.error):
+        buffer.close()
+        return None
+
+
+def warm_start(path: str) -> PoolSnapshot:
+    global _pool_snapshot
+
+    snapshot: Optional[PoolSnapshot] = load_snapshot(path)
+
+    if snapshot is None:
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "wb") as snapshot_file:
+            snapshot_file.write(export_snapshot())
+
+        os.replace(temporary_path, path)
+
+        snapshot = load_snapshot(path)
+
+    _pool_snapshot = snapshot
+
+    planet_pool_ids.cache_clear()
+    planet_pool.cache_clear()
+    supported_pool.cache_clear()
+
+    return snapshot
+
+
 # Archipelago Options
 class PopulousTBCommunityMissions(OptionSet):
     """
@@ -767,3 +2577,10 @@ class PopulousTBGimmickMissions(OptionSet):
     ]
 
     default = valid_keys
+
+
+# Bit i is set when PopulousTBCommunityMissions.valid_keys[i] is selected, the bit above them when gimmicks are on
+CAMPAIGN_BITS: Dict[str, int] = {key: 1 << index for index, key in enumerate(PopulousTBCommunityMissions.valid_keys)}
+
+GIMMICK_BIT: int = 1 << len(PopulousTBCommunityMissions.valid_keys)
+OPTION_MASK_COUNT: int = GIMMICK_BIT << 1
@@ -0,0 +1,6 @@
+import os
+import sys
+
+
+# The tests load the game module through the framework stand-ins in tools/standins.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
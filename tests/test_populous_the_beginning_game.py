@@ -0,0 +1,782 @@
+import csv
+import hashlib
+import io
+import itertools
+import os
+
+from collections import Counter
+from fractions import Fraction
+from random import Random
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+import standins
+
+populous = standins.load_game_module()
+
+CAMPAIGN_KEYS: List[str] = populous.PopulousTBCommunityMissions.valid_keys
+FULL_MASK: int = populous.OPTION_MASK_COUNT - 1
+
+# Digest of every option mask's planet pool as built by the original per-campaign lists, with the
+# "Seasons: Fall" option key and the duplicate "World Wide Web" entry fixed
+BASELINE_POOLS_DIGEST: str = "dfb0020939f6a4b83b0c3c236edc045e3944028afdcc6d9c0880baafbac2d568"
+
+
+def drawn_items(objectives: List[str]) -> Set[str]:
+    codec = populous.objective_codec()
+    templates = populous.objective_templates(FULL_MASK)
+
+    items: Set[str] = set()
+
+    for objective in objectives:
+        template_id, pool_id, item_id = codec.code(objective)
+
+        if pool_id != populous.NO_POOL:
+            collection, _ = list(templates[template_id].data.values())[pool_id]
+            items.add(collection()[item_id])
+
+    return items
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    yield str(tmp_path / "pools.snapshot")
+
+    populous._pool_snapshot = None
+
+    populous.planet_pool_ids.cache_clear()
+    populous.planet_pool.cache_clear()
+    populous.supported_pool.cache_clear()
+
+
+def clear_pool_caches() -> None:
+    for cached in (
+        populous.mission_catalog,
+        populous.planet_pool_ids,
+        populous.planet_pool,
+        populous.supported_pool,
+        populous.objective_templates,
+        populous.objective_sampler,
+        populous.objective_share_table,
+    ):
+        cached.cache_clear()
+
+
+@pytest.fixture
+def restricted_catalog(monkeypatch):
+    missions = populous.load_missions()
+
+    # Only the Matak are fought in the base campaign and only the Chumara in Tikal's Journey, and no
+    # mission has vehicles; the other campaigns keep their missing metadata
+    def load_missions():
+        restricted = list()
+
+        for mission in missions:
+            if mission.campaign == "The Beginning":
+                mission = mission._replace(enemy_tribes=frozenset({"Matak"}))
+            elif mission.campaign == "Tikal's Journey":
+                mission = mission._replace(enemy_tribes=frozenset({"Chumara"}))
+
+            restricted.append(mission._replace(vehicles=frozenset()))
+
+        return tuple(restricted)
+
+    monkeypatch.setattr(populous, "load_missions", load_missions)
+    clear_pool_caches()
+
+    yield
+
+    monkeypatch.undo()
+    clear_pool_caches()
+
+
+def test_planet_pools_match_the_baseline_for_every_mask():
+    digest = hashlib.sha256()
+
+    for mask in range(populous.OPTION_MASK_COUNT):
+        game = standins.make_game(*standins.options_for(mask))
+
+        assert game.option_mask == mask
+
+        digest.update("\n".join(game.planets()).encode("utf-8") + b"\n\n")
+
+    assert digest.hexdigest() == BASELINE_POOLS_DIGEST
+
+
+def test_planet_pool_sizes():
+    assert len(populous.planet_pool(0)) == 20
+    assert len(populous.planet_pool(populous.GIMMICK_BIT)) == 25
+    assert len(populous.planet_pool(FULL_MASK)) == 207
+
+
+def test_planet_pool_cache_is_shared_and_counts_hits_and_misses():
+    game_class = populous.PopulousTheBeginningGame
+    game_class.planet_pool_cache_clear()
+
+    first = standins.make_game(["Tikals Journey", "Ascension Chapter 1"], ["Gimmicks On"])
+    second = standins.make_game(["Ascension Chapter 1", "Tikals Journey"], ["Gimmicks On"])
+
+    planets = first.planets()
+
+    assert game_class.planet_pool_cache_info() == populous.PlanetPoolCacheInfo(hits=0, misses=1, currsize=1)
+
+    # The same selection in another order is the same cache entry, shared by both instances
+    assert second.planets() is planets
+    assert first.planets() is planets
+    assert isinstance(planets, tuple) and list(planets) == sorted(planets)
+
+    assert game_class.planet_pool_cache_info() == populous.PlanetPoolCacheInfo(hits=2, misses=1, currsize=1)
+
+    standins.make_game(list(), ["Gimmicks Off"]).planets()
+
+    assert game_class.planet_pool_cache_info() == populous.PlanetPoolCacheInfo(hits=2, misses=2, currsize=2)
+
+
+def test_fall_option_selects_autumn_missions():
+    game = standins.make_game(["Seasons: Fall"], ["Gimmicks Off"])
+
+    assert game.hasseasonautumn
+    assert "Seasons: Autumn - 1: Wind Howling" in game.planets()
+
+
+def test_world_wide_web_is_listed_once():
+    assert populous.planet_pool(FULL_MASK).count("Undiscovered Worlds - 4: World Wide Web") == 1
+
+
+def test_shared_objective_templates_cannot_be_modified():
+    game = standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"])
+    templates = game.game_objective_templates()
+
+    assert [id(template) for template in templates] == [
+        id(template) for template in standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"]).game_objective_templates()
+    ]
+
+    template = templates[0]
+
+    with pytest.raises(AttributeError):
+        template.weight = 100
+
+    with pytest.raises(AttributeError):
+        del template.label
+
+    with pytest.raises(TypeError):
+        template.data["PLANETS"] = (tuple, 1)
+
+    # The returned list is the caller's own, so changing it leaves the shared templates alone
+    templates.clear()
+
+    assert game.game_objective_templates()[0] is template
+
+
+@pytest.mark.parametrize(
+    "name", ["easychallenge", "mediumchallenge", "hardchallenge", "buildables", "tribe", "spells", "idols"]
+)
+def test_static_pools_are_the_same_immutable_object_on_every_call(name):
+    pool_method = getattr(populous.PopulousTheBeginningGame, name)
+    game = standins.make_game(list(), ["Gimmicks Off"])
+
+    assert pool_method() is pool_method()
+    assert getattr(game, name)() is pool_method()
+    assert isinstance(pool_method(), tuple)
+
+
+def test_option_mask_follows_live_option_changes():
+    game = standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"])
+
+    assert game.hastikals and game.hasgimmicks
+    assert len(game.planets()) == 207
+
+    game.archipelago_options.poptb_campaigns.value.discard("Tikals Journey")
+
+    assert not game.hastikals
+    assert not any(planet.startswith("Tikal's Journey") for planet in game.planets())
+
+    game.archipelago_options.poptb_gimmicks = populous.PopulousTBGimmickMissions(["Gimmicks Off"])
+
+    assert not game.hasgimmicks
+    assert "The Beginning - 22: Solo" not in game.planets()
+
+
+def test_mission_metadata_narrows_static_pools(restricted_catalog):
+    tikals: int = populous.CAMPAIGN_BITS["Tikals Journey"]
+
+    assert populous.supported_pool(0, "tribe") == ("Matak",)
+    assert populous.supported_pool(tikals, "tribe") == ("Matak", "Chumara")
+    assert populous.supported_pool(FULL_MASK, "tribe") == populous.TRIBES
+
+    game = standins.make_game(list(), ["Gimmicks Off"])
+    templates = {template.label: template for template in game.game_objective_templates()}
+
+    collection, _ = templates["Kill a TRIBE Shaman on any planet"].data["TRIBE"]
+
+    assert collection() == ("Matak",)
+    assert all(
+        objective == "Kill a Matak Shaman on any planet"
+        for objective in populous.objective_sampler(0, True, True).sample(5, 200)
+        if objective.endswith(" Shaman on any planet")
+    )
+
+    # No enabled planet has vehicles, so the objective asking for them is left out
+    assert "Have 10 BUILDABLES at once on any planet" not in templates
+
+
+def test_pack_planets_stays_within_the_budget():
+    estimates = populous.mission_estimates()
+
+    for budget_minutes in (0, 30, 120, 600):
+        budget = populous.pack_planets(FULL_MASK, budget_minutes, 3, max_difficulty=4)
+
+        assert budget.minutes <= budget_minutes
+        assert budget.minutes == sum(estimates[populous.STRINGS.intern(planet)].minutes for planet in budget.planets)
+        assert all(estimates[populous.STRINGS.intern(planet)].difficulty <= 4 for planet in budget.planets)
+
+    assert populous.pack_planets(FULL_MASK, -5, 3) == populous.PlanetBudget(planets=tuple(), minutes=0)
+
+    # A budget beyond every planet's total packs all of them without sizing anything to the budget
+    everything = populous.pack_planets(FULL_MASK, 4 * 10 ** 9, 1)
+
+    assert everything.planets == populous.planet_pool(FULL_MASK)
+    assert everything.minutes == sum(estimates[string_id].minutes for string_id in populous.planet_pool_ids(FULL_MASK))
+
+
+def test_incremental_planet_pool_applies_random_toggles():
+    rng = Random(3)
+    game = standins.make_game(["Seasons: Spring"], ["Gimmicks Off"])
+
+    pool = game.incremental_planet_pool()
+    changes: List[populous.PlanetPoolChange] = list()
+
+    pool.subscribe(changes.append)
+
+    assert pool.planets == populous.planet_pool(game.option_mask)
+
+    for _ in range(300):
+        before: Set[str] = set(pool.planets)
+        mask_before: int = pool.mask
+
+        action: int = rng.randrange(3)
+
+        if action == 0:
+            pool.set_campaign(rng.choice(CAMPAIGN_KEYS), rng.random() < 0.5)
+        elif action == 1:
+            pool.set_gimmicks(rng.random() < 0.5)
+        else:
+            pool.update(rng.randrange(populous.OPTION_MASK_COUNT))
+
+        assert pool.planets == populous.planet_pool(pool.mask)
+
+        if pool.mask == mask_before:
+            assert changes == list()
+            continue
+
+        change = changes.pop()
+
+        assert changes == list()
+        assert change.mask == pool.mask
+        assert set(change.added) == set(pool.planets) - before
+        assert set(change.removed) == before - set(pool.planets)
+        assert len(change.added) == len(set(change.added)) and len(change.removed) == len(set(change.removed))
+
+    pool.unsubscribe(changes.append)
+    pool.update(FULL_MASK if pool.mask != FULL_MASK else 0)
+
+    assert changes == list()
+
+
+def test_pool_snapshot_matches_pools_built_from_the_catalog(snapshot_path):
+    masks: List[int] = [0, 1, 5, populous.GIMMICK_BIT, populous.GIMMICK_BIT | 0x2A5, FULL_MASK]
+
+    cold = {mask: populous.build_planet_pool(mask) for mask in masks}
+    cold_tribes = {mask: populous.build_supported_pool(mask, "tribe") for mask in masks}
+
+    populous.warm_start(snapshot_path)
+
+    assert os.path.exists(snapshot_path)
+
+    # A fresh start from the existing snapshot reads every pool without building the catalog
+    populous.mission_catalog.cache_clear()
+    populous.warm_start(snapshot_path)
+
+    for mask in masks:
+        assert populous.planet_pool(mask) == cold[mask]
+        assert populous.supported_pool(mask, "tribe") == cold_tribes[mask]
+        assert populous.STRINGS.texts(populous.planet_pool_ids(mask)) == cold[mask]
+
+    populous.pack_planets(FULL_MASK, 120, 1)
+
+    assert populous.mission_catalog.cache_info().currsize == 0
+
+
+def test_stale_pool_snapshot_is_rebuilt(snapshot_path):
+    populous.warm_start(snapshot_path)
+
+    with open(snapshot_path, "r+b") as snapshot_file:
+        snapshot_file.seek(6)
+        snapshot_file.write(b"\0" * 32)
+
+    assert populous.load_snapshot(snapshot_path) is None
+
+    populous.warm_start(snapshot_path)
+
+    assert populous.load_snapshot(snapshot_path) is not None
+    assert populous.planet_pool(FULL_MASK) == populous.build_planet_pool(FULL_MASK)
+
+
+@pytest.mark.parametrize("weights", [[1], [10, 10, 10], [10, 1, 30, 5, 0, 10], [3, 7]])
+def test_alias_table_matches_the_weights(weights):
+    table = populous.AliasTable(weights)
+    count: int = len(weights)
+
+    # Each column is drawn with probability 1/count and keeps its own index with its stored probability
+    implied: List[float] = [probability / count for probability in table.probabilities]
+
+    for index, alias in enumerate(table.aliases):
+        implied[alias] += (1.0 - table.probabilities[index]) / count
+
+    assert implied == pytest.approx([weight / sum(weights) for weight in weights])
+
+    rng = Random(5)
+    draws = Counter(table.draw(rng) for _ in range(20000))
+
+    for index, weight in enumerate(weights):
+        assert draws[index] / 20000 == pytest.approx(weight / sum(weights), abs=0.015)
+
+
+def test_samplers_leave_out_filtered_templates():
+    for include_difficult in (False, True):
+        for include_time_consuming in (False, True):
+            sampler = populous.objective_sampler(FULL_MASK, include_difficult, include_time_consuming)
+
+            assert sampler.templates == tuple(
+                template for template in populous.objective_templates(FULL_MASK)
+                if (include_difficult or not template.is_difficult)
+                and (include_time_consuming or not template.is_time_consuming)
+            )
+
+    labels: Set[str] = {template.label for template in populous.objective_sampler(FULL_MASK, False, False).templates}
+
+    assert "HARDCHALLENGE" not in labels
+    assert "Complete a Planet in 30 minutes or less" not in labels
+
+
+def test_iter_objectives_yields_lazily():
+    game = standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"])
+    sampler = populous.objective_sampler(FULL_MASK, True, True)
+
+    objectives = game.iter_objectives(17)
+
+    assert iter(objectives) is objectives
+
+    # Without a count the stream never ends, and it draws the same objectives as a materialised sample
+    assert list(itertools.islice(objectives, 1000)) == sampler.sample(17, 1000)
+    assert next(objectives)
+
+    assert list(game.iter_objectives(17, 25)) == sampler.sample(17, 25)
+    assert list(game.iter_objectives(17, 0)) == list()
+
+
+@pytest.mark.parametrize(
+    "label, keys",
+    [
+        ("Kill a TRIBE Shaman on any planet", ("TRIBE",)),
+        ("EASYCHALLENGE", ("EASYCHALLENGE",)),
+        ("Complete a Planet in 30 minutes or less", ()),
+        ("Use SPELLS against the TRIBE, then SPELLS again", ("TRIBE", "SPELLS")),
+        ("No placeholder here", ("TRIBE",)),
+    ],
+)
+def test_compiled_labels_render_like_placeholder_replacement(label, keys):
+    compiled = populous.compile_label(label, keys)
+    values: List[str] = [f"<{index}>" for index in range(len(keys))]
+
+    expected: str = label
+
+    for key, value in zip(keys, values):
+        expected = expected.replace(key, value, 1)
+
+    parts: List[str] = [compiled.segments[0]]
+
+    for gap, slot in enumerate(compiled.slots, 1):
+        parts.extend((values[slot], compiled.segments[gap]))
+
+    assert "".join(parts) == expected
+    assert len(compiled.segments) == len(compiled.slots) + 1
+
+
+def test_format_many_renders_pool_indices():
+    sampler = populous.objective_sampler(FULL_MASK, True, True)
+
+    draws = list()
+    expected: List[str] = list()
+
+    for index, template in enumerate(sampler.templates):
+        picks = tuple(
+            pool[:min(quantity)] if isinstance(quantity, range) else pool[:quantity]
+            for _, pool, quantity in sampler.pools[index]
+        )
+
+        label: str = template.label
+
+        for (key, _, _), slot_picks in zip(sampler.pools[index], picks):
+            label = label.replace(key, ", ".join(populous.STRINGS.texts(slot_picks)), 1)
+
+        draws.append((index, picks))
+        expected.append(label)
+
+    assert sampler.format_many(draws) == expected
+    assert sampler.format_many(draws * 50) == expected * 50
+
+
+def test_sessions_never_combine_conflicting_entries():
+    sampler = populous.objective_sampler(FULL_MASK, True, True)
+
+    for seed in range(200):
+        items: Set[str] = drawn_items(sampler.session(seed).draw_many(40))
+
+        for entry, conflicts in populous.CONFLICTS:
+            if entry in items:
+                assert items.isdisjoint(conflicts), (seed, entry)
+
+
+def test_instrumentation_counts_pool_lookups_and_renders():
+    game = standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"])
+    planet_pool = populous.planet_pool
+
+    with populous.instrument() as instrumentation:
+        populous.objective_sampler(FULL_MASK, True, True).sample(1, 200)
+
+        for _ in range(10):
+            game.planets()
+
+        stats = instrumentation.snapshot()
+
+    assert stats["ObjectiveSampler.render"].calls == 200
+    assert stats["planets"].calls == 10
+    assert stats["planet_pool"].calls >= 10
+    assert stats["planet_pool"].max_pool_size == 207
+    assert stats["supported_pool"].calls > 0
+
+    assert populous.instrumentation_snapshot() == dict()
+    assert populous.planet_pool is planet_pool
+
+
+def test_conflict_index_is_symmetric():
+    index = populous.conflict_index()
+
+    for entry, conflicts in populous.CONFLICTS:
+        entry_id: int = populous.STRINGS.intern(entry)
+
+        for conflict in conflicts:
+            conflict_id: int = populous.STRINGS.intern(conflict)
+
+            assert conflict_id in index[entry_id]
+            assert entry_id in index[conflict_id]
+
+
+def test_conflicts_naming_unknown_entries_are_rejected(monkeypatch):
+    monkeypatch.setattr(
+        populous, "CONFLICTS", populous.CONFLICTS + (("Complete a Planet without using the Blast spell", ("Blsat",)),)
+    )
+
+    populous.conflict_index.cache_clear()
+
+    try:
+        with pytest.raises(populous.PopulousCatalogError):
+            populous.conflict_index()
+    finally:
+        monkeypatch.undo()
+        populous.conflict_index.cache_clear()
+
+
+def test_compatible_game_objectives_never_combine_conflicting_entries():
+    game = standins.make_game(CAMPAIGN_KEYS, ["Gimmicks On"])
+
+    for seed in range(50):
+        items: Set[str] = drawn_items(game.sample_compatible_objectives(seed, 60))
+
+        for entry, conflicts in populous.CONFLICTS:
+            if entry in items:
+                assert items.isdisjoint(conflicts), (seed, entry)
+
+
+def test_sessions_do_not_repeat_objectives_before_pools_run_out():
+    sampler = populous.objective_sampler(FULL_MASK, True, True)
+
+    for seed in range(50):
+        objectives: List[str] = sampler.session(seed).draw_many(30)
+
+        assert len(set(objectives)) == len(objectives), seed
+
+    # These templates have no conflicting entries, so their distinct pools bound the keep exactly
+    labels: Set[str] = {
+        "Complete PLANETS",
+        "Kill a TRIBE Shaman on any planet",
+        "Destroy the TRIBE Tribe on any planet",
+        "Fully worship a IDOLS on any planet",
+        "Complete a Planet in 30 minutes or less",
+    }
+
+    conflict_free = populous.ObjectiveSampler(
+        template for template in populous.objective_templates(FULL_MASK) if template.label in labels
+    )
+
+    capacity: int = len(populous.planet_pool(FULL_MASK)) + len(populous.TRIBES) + len(populous.IDOLS) + 1
+
+    for seed in range(20):
+        session = conflict_free.session(seed)
+        objectives = session.draw_many(capacity)
+
+        assert len(set(objectives)) == capacity, seed
+
+        # The next draw starts a fresh pass instead of running dry
+        assert session.draw() is not None
+
+
+def enumerated_distribution(mask: int, include_difficult: bool, include_time_consuming: bool) -> Dict[str, Fraction]:
+    sampler = populous.objective_sampler(mask, include_difficult, include_time_consuming)
+    total_weight: int = sum(template.weight for template in sampler.templates)
+
+    distribution: Dict[str, Fraction] = dict()
+
+    for index, template in enumerate(sampler.templates):
+        if not sampler.pools[index]:
+            distribution[sampler.format(index, ())] = Fraction(template.weight, total_weight)
+            continue
+
+        pool = sampler.pools[index][0][1]
+
+        for string_id, multiplicity in Counter(pool).items():
+            objective: str = sampler.format(index, ((string_id,),))
+            probability = Fraction(template.weight * multiplicity, total_weight * len(pool))
+
+            distribution[objective] = distribution.get(objective, Fraction(0)) + probability
+
+    return distribution
+
+
+@pytest.mark.parametrize("mask", [0, 1, populous.GIMMICK_BIT, populous.GIMMICK_BIT | 0x2A5, 0x800, FULL_MASK])
+def test_objective_distribution_matches_enumerated_pools(mask):
+    for include_difficult in (False, True):
+        for include_time_consuming in (False, True):
+            distribution = populous.objective_distribution(mask, include_difficult, include_time_consuming)
+
+            assert distribution == enumerated_distribution(mask, include_difficult, include_time_consuming)
+            assert sum(distribution.values()) == 1
+
+
+def test_objective_distribution_csv_lists_exact_probabilities():
+    output_file = io.StringIO()
+    masks: List[int] = [0, populous.GIMMICK_BIT | 0x2A5]
+
+    populous.write_objective_distribution_csv(output_file, masks)
+
+    distributions: Dict[Tuple[int, bool, bool], Dict[str, Fraction]] = dict()
+
+    for row in csv.DictReader(io.StringIO(output_file.getvalue())):
+        profile = (int(row["mask"]), row["include_difficult"] == "1", row["include_time_consuming"] == "1")
+        probability = Fraction(row["exact"])
+
+        assert "/" in row["exact"]
+        assert float(row["probability"]) == pytest.approx(float(probability))
+
+        distributions.setdefault(profile, dict())[row["objective"]] = probability
+
+    assert len(distributions) == 4 * len(masks)
+
+    for (mask, include_difficult, include_time_consuming), distribution in distributions.items():
+        assert distribution == populous.objective_distribution(mask, include_difficult, include_time_consuming)
+
+
+def test_objective_factors_csv_combines_into_the_distribution():
+    shares_file, factors_file = io.StringIO(), io.StringIO()
+    masks: List[int] = [0, populous.GIMMICK_BIT | 0x2A5]
+
+    populous.write_objective_factors_csv(shares_file, factors_file, masks)
+
+    shares = list(csv.DictReader(io.StringIO(shares_file.getvalue())))
+    factors = list(csv.DictReader(io.StringIO(factors_file.getvalue())))
+
+    assert len(shares) == len(set(share["objective"] for share in shares))
+    assert [int(row["mask"]) for row in factors] == masks
+
+    for row in factors:
+        mask: int = int(row["mask"])
+        distribution: Dict[str, Fraction] = dict()
+
+        for share in shares:
+            if share["is_difficult"] == "1":
+                continue
+
+            requires_any: List[int] = [int(bits) for bits in share["requires_any"].split()]
+
+            if not any(mask & bits == bits for bits in requires_any):
+                continue
+
+            pool_size: int = int(row[f"{share['pool']} pool size"]) if share["pool"] else 1
+
+            distribution[share["objective"]] = Fraction(
+                int(share["weight"]) * int(share["multiplicity"]), pool_size * int(row["total weight d0 t1"])
+            )
+
+        assert distribution == populous.objective_distribution(mask, False, True)
+
+
+def test_codec_round_trip():
+    codec = populous.objective_codec()
+    objectives: List[str] = populous.objective_sampler(FULL_MASK, True, True).sample(7, 500)
+
+    data: bytes = codec.encode(objectives)
+
+    assert len(data) == populous._objective_codec_header.size + 4 * len(objectives)
+    assert codec.decode(data) == objectives
+
+    every_objective: List[str] = list(codec.codes)
+
+    assert codec.decode(codec.encode(every_objective)) == every_objective
+
+
+def test_codec_writes_little_endian_codes():
+    codec = populous.objective_codec()
+    objectives: List[str] = populous.objective_sampler(FULL_MASK, True, True).sample(5, 3)
+
+    body: bytes = codec.encode(objectives)[populous._objective_codec_header.size:]
+
+    assert body == b"".join(codec.codes[objective].to_bytes(4, "little") for objective in objectives)
+
+
+def test_codec_rejects_another_catalog_version():
+    codec = populous.objective_codec()
+    data: bytearray = bytearray(codec.encode(["Complete a Planet in 30 minutes or less"]))
+
+    data[4] ^= 0xFF
+
+    with pytest.raises(ValueError):
+        codec.decode(bytes(data))
+
+
+def test_completion_tracker_round_trip(tmp_path):
+    path: str = str(tmp_path / "completion.log")
+    objectives: List[str] = populous.objective_sampler(FULL_MASK, True, True).sample(3, 50)
+
+    expected = dict()
+
+    with populous.ObjectiveCompletionTracker(path, compact_every=64) as tracker:
+        for index in range(500):
+            slot: int = index * 7 % 300
+            objective: str = objectives[index % len(objectives)]
+            completed: bool = index % 5 != 0
+
+            tracker.set_completed(slot, objective, completed)
+            expected[(slot, objective)] = completed
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        for (slot, objective), completed in expected.items():
+            assert tracker.is_completed(slot, objective) == completed
+
+        assert tracker.completed(0) == sorted(
+            (objective for (slot, objective), completed in expected.items() if slot == 0 and completed),
+            key=tracker.ids.__getitem__,
+        )
+
+
+def test_completion_tracker_discards_a_torn_trailing_record(tmp_path):
+    path: str = str(tmp_path / "completion.log")
+    first, second = populous.objective_sampler(FULL_MASK, True, True).sample(4, 2)
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        tracker.set_completed(7, first)
+
+    # An append interrupted part way through a record
+    with open(path, "ab") as log_file:
+        log_file.write(b"\x01\x02\x03")
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert tracker.is_completed(7, first)
+
+        tracker.set_completed(9, second)
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert tracker.is_completed(7, first)
+        assert tracker.is_completed(9, second)
+        assert not tracker.is_completed(9, first)
+
+
+def test_completion_tracker_follows_catalog_changes(tmp_path, monkeypatch):
+    path: str = str(tmp_path / "completion.log")
+    dropped: str = "Complete a Planet in 30 minutes or less"
+    objectives: List[str] = [
+        objective for objective in populous.objective_sampler(FULL_MASK, True, True).sample(6, 40)
+        if objective != dropped
+    ]
+
+    templates = populous.objective_templates(FULL_MASK)
+
+    with populous.ObjectiveCompletionTracker(path, compact_every=16) as tracker:
+        for index, objective in enumerate(objectives):
+            tracker.set_completed(index % 3, objective)
+
+        tracker.set_completed(5, dropped)
+
+    # A catalog with its templates reordered and one removed gives every objective a different id
+    changed = populous.ObjectiveCodec([template for template in reversed(templates) if template.label != dropped])
+    monkeypatch.setattr(populous, "objective_codec", lambda: changed)
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert tracker.version != populous.ObjectiveCodec(templates).version
+
+        for index, objective in enumerate(objectives):
+            assert tracker.is_completed(index % 3, objective)
+            assert not tracker.is_completed(index % 3 + 3, objective)
+
+        assert tracker.completed(5) == list()
+
+        tracker.set_completed(7, objectives[0])
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert tracker.is_completed(0, objectives[0])
+        assert tracker.is_completed(7, objectives[0])
+
+
+def test_completion_tracker_opens_an_empty_file(tmp_path):
+    path: str = str(tmp_path / "completion.log")
+    objective: str = "Complete a Planet in 30 minutes or less"
+
+    open(path, "wb").close()
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert not tracker.is_completed(0, objective)
+
+        tracker.set_completed(0, objective)
+
+    with populous.ObjectiveCompletionTracker(path) as tracker:
+        assert tracker.is_completed(0, objective)
+
+    with open(path, "wb") as completion_file:
+        completion_file.write(b"PTB")
+
+    with pytest.raises(ValueError):
+        populous.ObjectiveCompletionTracker(path)
+
+
+def test_objective_random_jump_skips_ahead():
+    reference = populous.ObjectiveRandom(11, 3, 5)
+    values: List[float] = [reference.random() for _ in range(20)]
+
+    skipped = populous.ObjectiveRandom(11, 3, 5)
+    skipped.jump(12)
+
+    assert skipped.random() == values[12]
+
+    restored = populous.ObjectiveRandom(0)
+    restored.setstate(skipped.getstate())
+
+    assert [restored.random() for _ in range(7)] == values[13:]
+
+
+def test_slot_objectives_do_not_depend_on_earlier_draws():
+    sampler = populous.objective_sampler(FULL_MASK, True, True)
+    slot_objectives: List[str] = sampler.sample_slot(99, 4, 30)
+
+    assert [sampler.sample_objective(99, 4, index) for index in range(30)] == slot_objectives
+    assert sampler.sample_slot("seed name", 4, 3) == sampler.sample_slot("seed name", 4, 3)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import standins
+
+
+# Usage: python tools/bench.py [--calls N] [--repeats R] [--tolerance T] [--update]
+# Results are compared against bench_baseline.json next to this file. Timings only compare on the machine
+# they were taken on, so the baseline is not committed: run with --update on a clean checkout first, or let
+# the first run write it, then benchmark changes against it
+
+populous: ModuleType = standins.load_game_module()
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# Budget for a fresh interpreter to import the game module, including every module it pulls in. The import
+# is only checked against this budget, as interpreter start-up varies too much to compare it with a baseline
+IMPORT_TIME_BUDGET_SECONDS: float = 0.02
+
+# Each entry is timed this many times and the fastest run is kept, as it is the least disturbed by the machine
+REPEATS: int = 5
+
+# Differences below these are timer, scheduler and allocator noise rather than regressions
+NOISE_FLOOR_SECONDS: float = 1e-6
+NOISE_FLOOR_BYTES: int = 1024
+
+# Run in a fresh interpreter: the stand-ins are installed first, then only the game module import is timed
+IMPORT_SCRIPT: str = """
+import sys
+import time
+
+sys.path.insert(0, {tools!r})
+
+import standins
+
+standins.install()
+
+start = time.perf_counter()
+standins.load_game_module()
+
+print(time.perf_counter() - start)
+"""
+
+
+# Timed with every run: baselines are scaled by how much faster or slower this workload ran than when the
+# baseline was written, so a machine that is throttled or busy does not show up as a regression
+def calibration_workload() -> int:
+    total: int = 0
+
+    for value in range(1000):
+        total += value * value
+
+    return total
+
+
+class BenchmarkResult(NamedTuple):
+    calls: int
+    seconds_per_call: float
+    peak_bytes: int
+
+
+def measure(function: Callable[[], Any], calls: int, repeats: int = REPEATS) -> BenchmarkResult:
+    # The first call fills caches and is not timed, and garbage left by earlier entries is collected first
+    function()
+    gc.collect()
+
+    seconds_per_call: float = min(timeit.repeat(function, number=calls, repeat=repeats)) / calls
+
+    # Allocations are measured on a separate call so tracing does not skew the timings
+    tracemalloc.start()
+
+    try:
+        function()
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(calls=calls, seconds_per_call=seconds_per_call, peak_bytes=peak)
+
+
+def measure_import(runs: int = 9) -> BenchmarkResult:
+    script: str = IMPORT_SCRIPT.format(tools=os.path.dirname(os.path.abspath(__file__)))
+
+    # Bytecode is cached the way it is on a client; the first run writes it and is discarded
+    environment: Dict[str, str] = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    timings: List[float] = [
+        float(subprocess.run(
+            [sys.executable, "-c", script], env=environment, capture_output=True, text=True, check=True
+        ).stdout)
+        for _ in range(runs + 1)
+    ]
+
+    return BenchmarkResult(calls=runs, seconds_per_call=min(timings[1:]), peak_bytes=0)
+
+
+def benchmark(calls: int = 1000, repeats: int = REPEATS) -> Dict[str, BenchmarkResult]:
+    results: Dict[str, BenchmarkResult] = dict()
+
+    results["calibration"] = measure(calibration_workload, 100, repeats)
+    results["import"] = measure_import()
+    results["mission_catalog[cold]"] = measure(populous.mission_catalog.__wrapped__, 10, repeats)
+
+    # The every-mask builds take about a second each, so they are repeated less
+    results["build_planet_pool[every mask]"] = measure(
+        lambda: [populous.build_planet_pool(mask) for mask in range(populous.OPTION_MASK_COUNT)], 1, 3
+    )
+
+    results["build_objective_templates[every mask]"] = measure(
+        lambda: [populous.build_objective_templates(mask) for mask in range(populous.OPTION_MASK_COUNT)], 1, 3
+    )
+
+    game_class: type = populous.PopulousTheBeginningGame
+    predicates: List[str] = sorted(name for name in dir(game_class) if name.startswith("has"))
+
+    profiles: Dict[str, Tuple[List[str], List[str]]] = {
+        "no campaigns, gimmicks off": (list(), ["Gimmicks Off"]),
+        "no campaigns, gimmicks on": (list(), ["Gimmicks On"]),
+        "all campaigns, gimmicks off": (populous.PopulousTBCommunityMissions.valid_keys, ["Gimmicks Off"]),
+        "all campaigns, gimmicks on": (populous.PopulousTBCommunityMissions.valid_keys, ["Gimmicks On"]),
+    }
+
+    for profile, (campaigns, gimmicks) in profiles.items():
+        game: Any = standins.make_game(campaigns, gimmicks)
+
+        results[f"planets[{profile}]"] = measure(game.planets, calls, repeats)
+        results[f"has*[{profile}]"] = measure(lambda: [getattr(game, name) for name in predicates], calls, repeats)
+        results[f"game_objective_templates[{profile}]"] = measure(game.game_objective_templates, calls, repeats)
+
+    for name in ("easychallenge", "mediumchallenge", "hardchallenge", "buildables", "tribe", "spells", "idols"):
+        results[name] = measure(getattr(game_class, name), calls, repeats)
+
+    return results
+
+
+def write_baseline(results: Dict[str, BenchmarkResult], baseline_path: str) -> None:
+    with open(baseline_path, "w", encoding="utf-8") as baseline_file:
+        json.dump({name: result._asdict() for name, result in results.items()}, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+
+def benchmark_regressions(
+    results: Dict[str, BenchmarkResult],
+    baseline_path: str,
+    tolerance: float = 1.5,
+) -> List[str]:
+    if not os.path.exists(baseline_path):
+        write_baseline(results, baseline_path)
+        return list()
+
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline: Dict[str, Dict[str, Any]] = json.load(baseline_file)
+
+    regressions: List[str] = list()
+
+    speed: float = 1.0
+
+    if "calibration" in results and "calibration" in baseline:
+        speed = results["calibration"].seconds_per_call / baseline["calibration"]["seconds_per_call"]
+
+    if "import" in results and results["import"].seconds_per_call > IMPORT_TIME_BUDGET_SECONDS:
+        regressions.append(
+            f"import: {results['import'].seconds_per_call * 1e3:.2f}ms, budget {IMPORT_TIME_BUDGET_SECONDS * 1e3:.2f}ms"
+        )
+
+    for name, result in results.items():
+        if name in ("calibration", "import") or name not in baseline:
+            continue
+
+        expected: BenchmarkResult = BenchmarkResult(**baseline[name])
+
+        expected_seconds: float = expected.seconds_per_call * speed
+        seconds_limit: float = max(expected_seconds * tolerance, expected_seconds + NOISE_FLOOR_SECONDS)
+
+        if result.seconds_per_call > seconds_limit:
+            regressions.append(
+                f"{name}: {result.seconds_per_call * 1e6:.2f}us per call, baseline {expected_seconds * 1e6:.2f}us "
+                f"at this machine speed"
+            )
+
+        if result.peak_bytes > max(expected.peak_bytes * tolerance, expected.peak_bytes + NOISE_FLOOR_BYTES):
+            regressions.append(f"{name}: {result.peak_bytes} bytes allocated, baseline {expected.peak_bytes} bytes")
+
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark the Populous game module")
+
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    results: Dict[str, BenchmarkResult] = benchmark(arguments.calls, arguments.repeats)
+
+    for name, result in results.items():
+        print(f"{name:<60} {result.seconds_per_call * 1e6:>12.2f}us {result.peak_bytes:>10} bytes")
+
+    if arguments.update:
+        write_baseline(results, arguments.baseline)
+        return 0
+
+    regressions: List[str] = benchmark_regressions(results, arguments.baseline, arguments.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
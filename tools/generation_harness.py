@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import json
+import os
+import sys
+import time
+
+from types import ModuleType
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import standins
+
+
+# Usage: python tools/generation_harness.py OUTPUT.jsonl [--items N] [--count C] [--workers W] [--shard-size S]
+# Generates objective sets across a process pool and streams them to OUTPUT.jsonl as JSON Lines
+
+populous: ModuleType = standins.load_game_module()
+
+
+class GenerationWorkItem(NamedTuple):
+    mask: int
+    seed: int
+    count: int = 10
+    include_difficult: bool = False
+    include_time_consuming: bool = False
+
+
+class GenerationReport(NamedTuple):
+    items: int
+    workers: int
+    seconds: float
+    items_per_second: float
+    items_per_second_per_worker: float
+    single_worker_items_per_second: float
+    scaling_efficiency: float
+
+
+# Drawn through a game instance and the framework's generate_objectives(), as Keymaster's Keep does, so
+# option mask resolution, the template list and the pool callables are all part of what is measured
+def generate_objective_set(item: GenerationWorkItem) -> Dict[str, Any]:
+    game: Any = standins.make_game(
+        *standins.options_for(item.mask),
+        include_difficult=item.include_difficult,
+        include_time_consuming=item.include_time_consuming,
+        seed=item.seed,
+    )
+
+    return {
+        "mask": item.mask,
+        "seed": item.seed,
+        "include_difficult": item.include_difficult,
+        "include_time_consuming": item.include_time_consuming,
+        "objectives": game.generate_objectives(item.count),
+    }
+
+
+# Module level so worker processes can unpickle it by reference
+def generate_objective_shard(items: List[GenerationWorkItem]) -> List[Dict[str, Any]]:
+    return [generate_objective_set(item) for item in items]
+
+
+# Every shard visits different option masks, so the shared caches are filled up front. Otherwise the
+# single-worker baseline would mostly time cold template construction, while forked workers inherit
+# whatever the parent had already built
+def warm_caches() -> None:
+    for mask in range(populous.OPTION_MASK_COUNT):
+        populous.planet_pool(mask)
+        populous.objective_templates(mask)
+
+
+def iter_work_items(total: int, count: int = 10) -> Iterator[GenerationWorkItem]:
+    # Walks every option mask, then every difficulty and duration combination
+    for index in range(total):
+        profile: int = index // populous.OPTION_MASK_COUNT
+
+        yield GenerationWorkItem(
+            mask=index % populous.OPTION_MASK_COUNT,
+            seed=index,
+            count=count,
+            include_difficult=bool(profile & 1),
+            include_time_consuming=bool(profile & 2),
+        )
+
+
+def iter_shards(items: Iterable[GenerationWorkItem], shard_size: int) -> Iterator[List[GenerationWorkItem]]:
+    iterator: Iterator[GenerationWorkItem] = iter(items)
+
+    while True:
+        shard: List[GenerationWorkItem] = list(itertools.islice(iterator, shard_size))
+
+        if not shard:
+            return
+
+        yield shard
+
+
+def run_generation_harness(
+    items: Iterable[GenerationWorkItem],
+    output_path: str,
+    workers: Optional[int] = None,
+    shard_size: int = 256,
+    max_pending: Optional[int] = None,
+) -> GenerationReport:
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    shards: Iterator[List[GenerationWorkItem]] = iter_shards(items, shard_size)
+    first_shard: Optional[List[GenerationWorkItem]] = next(shards, None)
+
+    if first_shard is None:
+        return GenerationReport(0, workers, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    warm_caches()
+
+    # One shard run in-process gives the single-worker throughput that scaling is compared against
+    start: float = time.perf_counter()
+    generate_objective_shard(first_shard)
+    single_worker_items_per_second: float = len(first_shard) / max(time.perf_counter() - start, 1e-9)
+
+    count: int = 0
+    start = time.perf_counter()
+
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        # Forked workers start from the parent's warm caches; spawned ones warm their own before any shard
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=warm_caches) as executor:
+            # Shards are submitted as earlier ones are written, so at most max_pending are held in memory
+            pending: Deque[concurrent.futures.Future] = collections.deque()
+
+            def write_oldest() -> int:
+                results: List[Dict[str, Any]] = pending.popleft().result()
+
+                for result in results:
+                    output_file.write(json.dumps(result) + "\n")
+
+                return len(results)
+
+            for shard in itertools.chain((first_shard,), shards):
+                if len(pending) >= max_pending:
+                    count += write_oldest()
+
+                pending.append(executor.submit(generate_objective_shard, shard))
+
+            while pending:
+                count += write_oldest()
+
+    seconds: float = time.perf_counter() - start
+    items_per_second: float = count / max(seconds, 1e-9)
+
+    return GenerationReport(
+        items=count,
+        workers=workers,
+        seconds=seconds,
+        items_per_second=items_per_second,
+        items_per_second_per_worker=items_per_second / workers,
+        single_worker_items_per_second=single_worker_items_per_second,
+        scaling_efficiency=items_per_second / (single_worker_items_per_second * workers),
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Generate Populous objective sets in bulk")
+
+    parser.add_argument("output")
+    parser.add_argument("--items", type=int, default=4 * populous.OPTION_MASK_COUNT)
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=256)
+
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    report: GenerationReport = run_generation_harness(
+        iter_work_items(arguments.items, arguments.count),
+        arguments.output,
+        workers=arguments.workers,
+        shard_size=arguments.shard_size,
+    )
+
+    for field, value in report._asdict().items():
+        print(f"{field:<32} {value:.3f}" if isinstance(value, float) else f"{field:<32} {value}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
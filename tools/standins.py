@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import enum
+import importlib.util
+import os
+import sys
+import types
+
+from random import Random
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+# Local stand-ins for the Archipelago and Keymaster's Keep pieces the game module imports, so the
+# benchmark, the generation harness and the tests can load it outside of a Keymaster's Keep checkout
+
+GAME_MODULE_NAME: str = "keymasters_keep.games.populous_the_beginning_game"
+
+GAME_MODULE_PATH: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "populous_the_beginning_game.py",
+)
+
+
+class OptionSet:
+    valid_keys: List[str] = list()
+    default: Any = frozenset()
+
+    value: set
+
+    def __init__(self, value: Iterable[str]) -> None:
+        self.value = set(value)
+
+
+class KeymastersKeepGamePlatforms(enum.Enum):
+    PC = "PC"
+    X360 = "X360"
+
+
+class GameObjectiveTemplate:
+    label: str
+    data: Dict[str, Tuple[Callable[[], Any], Union[int, range]]]
+    is_time_consuming: bool
+    is_difficult: bool
+    weight: int
+
+    def __init__(
+        self,
+        label: str,
+        data: Dict[str, Tuple[Callable[[], Any], Union[int, range]]],
+        is_time_consuming: bool = False,
+        is_difficult: bool = False,
+        weight: int = 1,
+    ) -> None:
+        self.label = label
+        self.data = data
+        self.is_time_consuming = is_time_consuming
+        self.is_difficult = is_difficult
+        self.weight = weight
+
+    def generate_game_objective(self, random: Random) -> str:
+        objective: str = self.label
+
+        for key, (collection, quantity) in self.data.items():
+            if isinstance(quantity, range):
+                quantity = random.choice(quantity)
+
+            objective = objective.replace(key, ", ".join(random.sample(collection(), quantity)), 1)
+
+        return objective
+
+
+class Game:
+    name: str
+    options_cls: Any = None
+
+    random: Random
+    include_time_consuming_objectives: bool
+    include_difficult_objectives: bool
+    archipelago_options: Any
+
+    def __init__(
+        self,
+        random: Optional[Random] = None,
+        include_time_consuming_objectives: bool = False,
+        include_difficult_objectives: bool = False,
+        archipelago_options: Any = None,
+    ) -> None:
+        self.random = random or Random()
+        self.include_time_consuming_objectives = include_time_consuming_objectives
+        self.include_difficult_objectives = include_difficult_objectives
+        self.archipelago_options = archipelago_options
+
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        raise NotImplementedError
+
+    def filtered_game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        return [
+            template for template in self.game_objective_templates()
+            if (self.include_difficult_objectives or not template.is_difficult)
+            and (self.include_time_consuming_objectives or not template.is_time_consuming)
+        ]
+
+    def generate_objectives(self, count: int = 1) -> List[str]:
+        templates: List[GameObjectiveTemplate] = self.filtered_game_objective_templates()
+        weights: List[int] = [template.weight for template in templates]
+
+        return [
+            template.generate_game_objective(self.random)
+            for template in self.random.choices(templates, weights=weights, k=count)
+        ]
+
+
+def install() -> None:
+    # A real framework that is already imported is left alone
+    modules: Dict[str, Dict[str, Any]] = {
+        "Options": {"OptionSet": OptionSet},
+        "keymasters_keep": {"__path__": list()},
+        "keymasters_keep.games": {"__path__": list()},
+        "keymasters_keep.game": {"Game": Game},
+        "keymasters_keep.game_objective_template": {"GameObjectiveTemplate": GameObjectiveTemplate},
+        "keymasters_keep.enums": {"KeymastersKeepGamePlatforms": KeymastersKeepGamePlatforms},
+    }
+
+    for name, attributes in modules.items():
+        if name in sys.modules:
+            continue
+
+        module: types.ModuleType = types.ModuleType(name)
+        module.__dict__.update(attributes)
+
+        sys.modules[name] = module
+
+
+def load_game_module() -> types.ModuleType:
+    module: Optional[types.ModuleType] = sys.modules.get(GAME_MODULE_NAME)
+
+    if module is not None:
+        return module
+
+    install()
+
+    spec = importlib.util.spec_from_file_location(GAME_MODULE_NAME, GAME_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+
+    sys.modules[GAME_MODULE_NAME] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[GAME_MODULE_NAME]
+        raise
+
+    return module
+
+
+# Option values that resolve to the given option mask
+def options_for(mask: int) -> Tuple[List[str], List[str]]:
+    module: types.ModuleType = load_game_module()
+
+    campaigns: List[str] = [key for key, bit in module.CAMPAIGN_BITS.items() if mask & bit]
+    gimmicks: List[str] = ["Gimmicks On"] if mask & module.GIMMICK_BIT else ["Gimmicks Off"]
+
+    return campaigns, gimmicks
+
+
+def make_game(
+    campaigns: Iterable[str],
+    gimmicks: Iterable[str],
+    include_difficult: bool = True,
+    include_time_consuming: bool = True,
+    seed: int = 0,
+) -> Any:
+    module: types.ModuleType = load_game_module()
+
+    return module.PopulousTheBeginningGame(
+        random=Random(seed),
+        include_time_consuming_objectives=include_time_consuming,
+        include_difficult_objectives=include_difficult,
+        archipelago_options=module.PopulousTheBeginningArchipelagoOptions(
+            poptb_campaigns=module.PopulousTBCommunityMissions(campaigns),
+            poptb_gimmicks=module.PopulousTBGimmickMissions(gimmicks),
+        ),
+    )